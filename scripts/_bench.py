@@ -0,0 +1,18 @@
+"""Timing helper shared by the benchmark scripts."""
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+# Unit -> (seconds multiplier, decimals shown).
+_UNITS = {"ms": (1e3, 2), "us": (1e6, 1)}
+
+
+def bench(
+    label: str, fn: Callable[[], Any], number: int, repeat: int, unit: str = "ms"
+) -> float:
+    """Print and return the best time per call of `fn`, in seconds."""
+    best = min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+    scale, decimals = _UNITS[unit]
+    print(f"  {label:<44} {best * scale:>12.{decimals}f} {unit}")
+    return best
@@ -0,0 +1,80 @@
+"""Benchmark the vectorized composite score.
+
+Compares the original row-by-row `aggregate_samples` loop from
+scripts/analysis.py against `specieval.composite.composite_scores`, which
+scores a whole DataFrame at once, over synthetic respondent-like answers with
+a share of missing values.
+
+Usage:
+    python scripts/benchmark_composite.py
+    python scripts/benchmark_composite.py --rows 10000 --repeat 5
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+from _bench import bench
+from specieval.composite import COMPOSITE_QUESTIONS, composite_scores
+
+
+def legacy_aggregate(samples: pd.DataFrame, questions: list[str]) -> pd.Series:
+    """The original row-by-row composite from scripts/analysis.py, the baseline."""
+    aggregated = pd.Series(index=samples.index, dtype=float)
+    for ind in aggregated.index:
+        s = samples.loc[ind]
+        total, count = 0.0, 0
+        for q in questions:
+            if q in s.index and pd.notna(s[q]):
+                sample = s[q]
+                if any(q.startswith(p) for p in ("spec_", "la4N_", "se4N_")):
+                    sample = 8 - sample
+                total += sample
+                count += 1
+        if count == len(questions):
+            aggregated[ind] = 100 * (total - len(questions)) / (6 * len(questions))
+    return aggregated
+
+
+def synthetic_frame(rows: int, missing: float, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    columns = [*COMPOSITE_QUESTIONS, "la4N_1", "Country"]
+    # Likert answers and epoch means of them.
+    values = (
+        rng.integers(1, 8, (rows, len(columns))) / rng.choice([1, 3, 10], rows)[:, None]
+    )
+    frame = pd.DataFrame(values, columns=columns, index=[f"r{i}" for i in range(rows)])
+    return frame.mask(rng.random(frame.shape) < missing)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark the composite score")
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--missing", type=float, default=0.01)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    frame = synthetic_frame(args.rows, args.missing)
+    questions = list(COMPOSITE_QUESTIONS)
+    pd.testing.assert_series_equal(
+        composite_scores(frame, questions), legacy_aggregate(frame, questions)
+    )
+
+    print(f"Composite score ({args.rows:,} rows per call):")
+    before = bench(
+        "before: row-by-row loop",
+        lambda: legacy_aggregate(frame, questions),
+        1,
+        args.repeat,
+    )
+    after = bench(
+        "after: composite_scores",
+        lambda: composite_scores(frame, questions),
+        1,
+        args.repeat,
+    )
+    print(f"  speedup: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
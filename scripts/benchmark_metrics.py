@@ -0,0 +1,122 @@
+"""Benchmark the refusal-aware metrics and epoch reducer.
+
+Compares the original list-based implementations (filter the scores into a
+list of floats, then `statistics.mean` / `np.std`) against the running-moments
+versions now in `specieval.scorers.refusal`, over synthetic Likert scores with
+a share of refusals.
+
+Usage:
+    python scripts/benchmark_metrics.py
+    python scripts/benchmark_metrics.py --samples 100000 --repeat 5
+"""
+
+import argparse
+import random
+import statistics
+from collections.abc import Callable
+from typing import cast
+
+import numpy as np
+from _bench import bench
+from inspect_ai.scorer import NOANSWER, SampleScore, Score, Value, value_to_float
+from specieval.scorers.refusal import _is_refusal, mean, mean_valid, std
+
+MetricFn = Callable[[list[SampleScore]], float]
+
+
+def legacy_mean(scores: list[SampleScore]) -> float:
+    """The original `mean` metric, kept here as the baseline."""
+    to_float = value_to_float()
+    values = [to_float(s.score.value) for s in scores if not _is_refusal(s.score.value)]
+    return statistics.mean(values) if values else float("nan")
+
+
+def legacy_std(scores: list[SampleScore]) -> float:
+    """The original `std` metric, kept here as the baseline."""
+    to_float = value_to_float()
+    values = [to_float(s.score.value) for s in scores if not _is_refusal(s.score.value)]
+    return float(np.std(values, ddof=1)) if len(values) > 1 else 0.0
+
+
+def legacy_mean_valid(scores: list[Score]) -> Score:
+    """The original `mean_valid` reducer, kept here as the baseline."""
+    to_float = value_to_float()
+    valid = [s for s in scores if not _is_refusal(s.value)]
+    if not valid:
+        return Score(
+            value=NOANSWER, explanation=f"All {len(scores)} epochs refused; excluded."
+        )
+    return Score(
+        value=statistics.mean([to_float(s.value) for s in valid]),
+        explanation=(
+            f"Mean over {len(valid)}/{len(scores)} valid epochs "
+            f"({len(scores) - len(valid)} refusals excluded)."
+        ),
+    )
+
+
+def synthetic_value(rng: random.Random, refusal_rate: float) -> float | str:
+    if rng.random() < refusal_rate:
+        return NOANSWER
+    # Epoch means of Likert answers, as the sample metrics see them.
+    return rng.randint(1, 70) / 10
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark the refusal-aware metrics")
+    ap.add_argument("--samples", type=int, default=1_000_000)
+    ap.add_argument("--epochs", type=int, default=10)
+    ap.add_argument("--refusal-rate", type=float, default=0.1)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    samples = [
+        SampleScore(score=Score(value=synthetic_value(rng, args.refusal_rate)))
+        for _ in range(args.samples)
+    ]
+    metric_mean, metric_std = cast(MetricFn, mean()), cast(MetricFn, std())
+    reduce = mean_valid()
+    assert metric_mean(samples) == legacy_mean(samples)
+    assert metric_std(samples) == legacy_std(samples)
+
+    print(f"Sample metrics ({args.samples:,} SampleScores per call):")
+    for name, legacy, current in [
+        ("mean", legacy_mean, metric_mean),
+        ("std", legacy_std, metric_std),
+    ]:
+        before = bench(
+            f"before: {name} via list", lambda: legacy(samples), 1, args.repeat
+        )
+        after = bench(
+            f"after: {name} via moments", lambda: current(samples), 1, args.repeat
+        )
+        print(f"  speedup: {before / after:.1f}x\n")
+
+    choices: list[Value] = [1, 2, 3, 4, 5, 6, 7, NOANSWER]
+    groups = [
+        [Score(value=rng.choice(choices)) for _ in range(args.epochs)]
+        for _ in range(args.samples // args.epochs)
+    ]
+    for g in groups[:1000]:
+        new, old = reduce(g), legacy_mean_valid(g)
+        assert (new.value, new.explanation) == (old.value, old.explanation)
+
+    print(f"Epoch reducer ({len(groups):,} samples x {args.epochs} epochs per call):")
+    before = bench(
+        "before: mean_valid via list",
+        lambda: [legacy_mean_valid(g) for g in groups],
+        1,
+        args.repeat,
+    )
+    after = bench(
+        "after: mean_valid via moments",
+        lambda: [reduce(g) for g in groups],
+        1,
+        args.repeat,
+    )
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
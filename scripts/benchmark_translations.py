@@ -0,0 +1,121 @@
+"""Benchmark translation lookups and task construction.
+
+Compares the original per-instance approach (re-read the CSV with pandas for
+every `Translations`, then boolean-mask the DataFrame on every lookup) against
+the shared, indexed catalog now used by `Translations`, and the cold catalog
+load from CSV text against the precompiled, memory-mapped bundle.
+
+Usage:
+    python scripts/benchmark_translations.py
+    python scripts/benchmark_translations.py --repeat 20
+"""
+
+import argparse
+
+import pandas as pd
+from _bench import bench
+from specieval.tasks import attitude_meat, attitude_seafood, sentience, speciesism
+from specieval.translations import Language, Translations
+from specieval.translations.bundle import BUNDLE_NAME, csv_digest, read_table
+from specieval.translations.translations import (
+    _load_catalog,
+    default_path,
+    parse_csv,
+)
+
+TASK_FNS = [speciesism, sentience, attitude_meat, attitude_seafood]
+
+
+def legacy_get_string(df: pd.DataFrame, string_id: str, lang_code: str) -> str:
+    """The original DataFrame-scan lookup, kept here as the baseline."""
+    row = df[df["string_id"] == string_id]
+    if row.empty:
+        raise KeyError(f"String ID not found: {string_id}")
+    return row[lang_code].iloc[0]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark translation lookups")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    df = pd.read_csv(default_path(), comment="#")
+    keys = [(sid, lang) for sid in df["string_id"] for lang in Language]
+    translations = Translations()
+
+    print(f"Lookup ({len(keys)} string x language pairs per call):")
+    before = bench(
+        "before: DataFrame mask per lookup",
+        lambda: [legacy_get_string(df, s, str(lang)) for s, lang in keys],
+        number=1,
+        repeat=args.repeat,
+        unit="us",
+    )
+    after = bench(
+        "after: catalog dict lookup",
+        lambda: [translations.get_string(s, lang) for s, lang in keys],
+        number=20,
+        repeat=args.repeat,
+        unit="us",
+    )
+    print(f"  speedup: {before / after:.0f}x\n")
+
+    print("Construction:")
+    before = bench(
+        "before: pd.read_csv per Translations()",
+        lambda: pd.read_csv(default_path(), comment="#"),
+        number=5,
+        repeat=args.repeat,
+        unit="us",
+    )
+    after = bench(
+        "after: shared catalog per Translations()",
+        Translations,
+        number=1000,
+        repeat=args.repeat,
+        unit="us",
+    )
+    print(f"  speedup: {before / after:.0f}x\n")
+
+    print("Cold catalog load (once per process):")
+    data = default_path().read_bytes()
+    bundle_path = default_path().parent / BUNDLE_NAME
+    before = bench(
+        "before: parse CSV text",
+        lambda: parse_csv(data.decode("utf-8")),
+        number=50,
+        repeat=args.repeat,
+        unit="us",
+    )
+    after = bench(
+        "after: hash CSV + mmap bundle",
+        lambda: read_table(bundle_path, default_path().name, csv_digest(data)),
+        number=50,
+        repeat=args.repeat,
+        unit="us",
+    )
+    print(f"  speedup: {before / after:.1f}x\n")
+
+    sweep = [(fn, lang) for fn in TASK_FNS for lang in Language]
+    print(
+        f"Task sweep ({len(sweep)} tasks: 4 assessments x {len(Language)} languages):"
+    )
+
+    def cold_sweep():
+        for fn, lang in sweep:
+            _load_catalog.cache_clear()  # re-parse per task, as before
+            fn(language=lang)
+
+    def warm_sweep():
+        for fn, lang in sweep:
+            fn(language=lang)
+
+    before = bench("before: catalog rebuilt per task", cold_sweep, 1, args.repeat, "us")
+    after = bench(
+        "after: catalog shared across tasks", warm_sweep, 1, args.repeat, "us"
+    )
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
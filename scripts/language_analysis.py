@@ -1,13 +1,18 @@
 import argparse
-import json
 import logging
+import statistics
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, List, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from matplotlib.colors import TwoSlopeNorm
+from specieval.assessments import assessment_for, parse_sample_id
+from specieval.manifest import ManifestLog, read_manifest
+from specieval.results import assessment_scores, read_results
 
 # Configure logging
 logging.basicConfig(
@@ -21,58 +26,110 @@ def parse_args() -> argparse.Namespace:
         description="Generate SpeciEval language comparison table"
     )
     parser.add_argument("--logs-dir", default="logs", help="Directory containing logs")
+    parser.add_argument(
+        "--store",
+        help="Read the results store built by `python -m specieval.results` "
+        "instead of the logs.json manifests under --logs-dir",
+    )
     parser.add_argument("--output-dir", default="images", help="Output directory")
     return parser.parse_args()
 
 
+def sweep_scores(log: ManifestLog) -> Iterator[Tuple[str, str, float]]:
+    """Per-(language, assessment) scores from a single specieval_sweep log.
+
+    Mirrors each per-language task's `mean` metric: the mean of the question
+    reductions in the group, excluding fully-refused (non-numeric) questions.
+    Yields (language, task, score).
+    """
+    groups: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+    for sample in log.samples:
+        if sample.sample_id is None:
+            continue
+        lang, question = parse_sample_id(sample.sample_id)
+        task = assessment_for(question)
+        value = sample.value
+        if lang is None or task is None or not isinstance(value, (int, float)):
+            continue
+        groups[(lang, task)].append(value)
+    for (lang, task), v in groups.items():
+        yield lang, task, statistics.mean(v)
+
+
 def parse_logs(logs_path: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Parse a single logs.json file, streaming it one log at a time."""
+    scores: Dict[str, List[Any]] = {
+        "model": [],
+        "task": [],
+        "language": [],
+        "score": [],
+    }
+    samples: Dict[str, List[Any]] = {
+        "model": [],
+        "language": [],
+        "question": [],
+        "score": [],
+    }
+
+    def add_score(model: str, task: str, lang: str, score: float | None) -> None:
+        scores["model"].append(model)
+        scores["task"].append(task)
+        scores["language"].append(lang)
+        scores["score"].append(score)
+
     try:
-        with open(logs_path, "r") as f:
-            logs = json.load(f)
+        for log in read_manifest(logs_path):
+            if log.status != "success":
+                continue
+            if log.model is None or log.task_registry_name is None:
+                continue
+            model = log.model.split("/")[-1]
+            task = log.task_registry_name.split("/")[-1]
+            if task == "specieval_sweep":
+                for lang, assessment, score in sweep_scores(log):
+                    add_score(model, assessment, lang, score)
+                continue
+            lang = log.language or "en"
+            add_score(model, task, lang, log.metrics.get("mean"))
+            for sample in log.samples:
+                if sample.sample_id:
+                    samples["model"].append(model)
+                    samples["language"].append(lang)
+                    samples["question"].append(sample.sample_id)
+                    samples["score"].append(sample.value)
     except Exception:
         return pd.DataFrame(), pd.DataFrame()
-    scores, samples = [], []
-    for _, log in logs.items():
-        if log.get("status") != "success":
-            continue
-        model = log["eval"]["model"].split("/")[-1]
-        task = log["eval"]["task_registry_name"].split("/")[-1]
-        lang = log["eval"]["task_args"].get("language", "en")
-        try:
-            score = log["results"]["scores"][0]["metrics"]["mean"]["value"]
-        except Exception:
-            score = None
-        scores.append({"model": model, "task": task, "language": lang, "score": score})
-        try:
-            for sample in log["reductions"][0]["samples"]:
-                if sample.get("sample_id"):
-                    samples.append(
-                        {
-                            "model": model,
-                            "language": lang,
-                            "question": sample["sample_id"],
-                            "score": sample.get("value", 0),
-                        }
-                    )
-        except Exception:
-            pass
     return pd.DataFrame(scores), pd.DataFrame(samples)
 
 
+def store_scores(store: Path) -> pd.DataFrame:
+    """`parse_logs`-shaped per-(model, assessment, language) scores from the store."""
+    results = read_results(
+        store, columns=["model", "task", "language", "assessment", "question", "score"]
+    )
+    scores = assessment_scores(results).drop(columns="task")
+    return scores.rename(columns={"assessment": "task"})
+
+
 def main() -> None:
     args = parse_args()
     logs_dir, output_dir = Path(args.logs_dir), Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
-    logs_paths = sorted(list(logs_dir.glob("**/logs.json")))
-
-    df_scores_lang = pd.DataFrame()
+    if args.store:
+        # One pass over the columnar store instead of every manifest.
+        all_scores: Iterable[pd.DataFrame] = [store_scores(Path(args.store))]
+    else:
+        logs_paths = sorted(list(logs_dir.glob("**/logs.json")))
+        all_scores = (parse_logs(path)[0] for path in logs_paths)
+
+    # Per-manifest pivots, concatenated once after the loop.
+    pivots: List[pd.DataFrame] = []
     exclude_models = [
         "gemini-2.5-flash-preview-05-20",
         "gemini-2.5-pro-preview-03-25",
     ]
 
-    for path in logs_paths:
-        scores, _ = parse_logs(path)
+    for scores in all_scores:
         if scores.empty:
             continue
         pivot = scores.pivot_table(
@@ -80,8 +137,11 @@ def main() -> None:
         )
         pivot.columns = pivot.columns.str.replace("_task", "")
         pivot = pivot[~pivot.index.get_level_values(0).isin(exclude_models)]
-        df_scores_lang = pd.concat([df_scores_lang, pivot], axis=0)
+        pivots.append(pivot)
 
+    if not pivots:
+        return
+    df_scores_lang = pd.concat(pivots, axis=0)
     if df_scores_lang.empty:
         return
     df_scores_lang = df_scores_lang.groupby(level=[0, 1]).mean()
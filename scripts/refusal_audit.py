@@ -1,8 +1,15 @@
 """Audit SpeciEval logs for refusals / unparseable answers.
 
-For every .eval log, count per-epoch samples whose likert score is NOANSWER
-("N") or otherwise failed extraction, so we can spot models whose ranking is
-contaminated by refusals.
+For every .eval log, count per-epoch samples the likert scorer scored NOANSWER
+(no in-range "ANSWER: N"), so we can spot models whose ranking is contaminated
+by refusals. Refusals are read from the stored likert scores, not re-parsed
+from the completions.
+
+Logs are read with `specieval.logscan`: each log's header is read first, so
+failed (and, for the gate, non-English) logs are skipped without touching
+their samples; the rest are read through their sample summaries (ids and
+scores, no message histories) in a process pool (--jobs). Adaptive-epoch
+samples count each of their internal epochs, as the results store does.
 
 Two modes:
 
@@ -10,7 +17,8 @@ Two modes:
 - --min-scorable X: the admission gate. Groups logs by *model* (not directory)
   and requires every individual question to have >= X of its English epochs
   scorable, else the model is unfit for the rankings. Also fails allowed models
-  with no logs or a missing assessment. Exits non-zero if any allowed (ranked)
+  with no logs or a missing assessment (specieval_all and specieval_sweep logs
+  count towards each assessment they cover). Exits non-zero if any allowed (ranked)
   model fails, so it can guard the table.
 
 Usage:
@@ -20,12 +28,14 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
 from collections import defaultdict
 from pathlib import Path
 
-from inspect_ai.log import read_eval_log
-from inspect_ai.scorer import NOANSWER
+from specieval.assessments import sample_task
+from specieval.logscan import Counts, DirectoryRefusals, QuestionCounts, scan
+from specieval.results import read_results
 
 # Admission policy: every question must have >= this fraction of its English
 # epochs scorable (chosen at 80% == at most 2 refusals in 10 epochs).
@@ -35,40 +45,20 @@ GATE_MIN_SCORABLE = 0.8
 EXPECTED_TASKS = {"speciesism", "sentience", "attitude_meat", "attitude_seafood"}
 
 
-def get_likert_score(sample):
-    """Return the sample's likert score object, regardless of scorer key name.
-
-    Older runs named the scorer "likert_scorer"; current runs use "likert".
-    Each sample has exactly one scorer, so return whatever is there.
-    """
-    if not sample.scores:
-        return None
-    for key in ("likert", "likert_scorer"):
-        if key in sample.scores:
-            return sample.scores[key]
-    # Fall back to the sole score present.
-    return next(iter(sample.scores.values()))
-
-
-def is_refusal(score) -> bool:
-    """True if a likert score represents a refusal / failed extraction."""
-    if score is None:
-        return True
-    val = score.value
-    if val == NOANSWER:  # "N"
-        return True
-    # The scorer returns NOANSWER on failure, but the mean reducer coerces it
-    # to 0; a non-numeric value or explicit error explanation is the tell.
-    if isinstance(val, str):
-        return True
-    if score.explanation and "Error extracting score" in score.explanation:
-        return True
-    return False
-
-
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Audit logs for refusals")
     p.add_argument("--logs-dir", default="logs")
+    p.add_argument(
+        "--store",
+        help="Read the results store built by `python -m specieval.results` "
+        "instead of scanning the .eval logs",
+    )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes reading logs (default: one per CPU)",
+    )
     p.add_argument(
         "--threshold",
         type=float,
@@ -90,8 +80,37 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
+def _warn(failed: list[tuple[Path, Exception]]) -> None:
+    for path, e in failed:
+        print(f"  WARN: failed to read {path}: {e}")
+
+
+def question_counts(logs_dir: Path, jobs: int = 1) -> Counts:
+    """(model_short, task, question) -> [total, refused] over English epochs."""
+    counts = QuestionCounts(english_only=True)
+    _warn(scan(sorted(logs_dir.glob("**/*.eval")), [counts], jobs))
+    return counts.counts
+
+
+def store_question_counts(store: Path) -> Counts:
+    """`question_counts` from the results store (no logs are read)."""
+    results = read_results(
+        store,
+        columns=["model", "task", "question", "refused"],
+        filters=[("language", "=", "en")],
+    )
+    results["task"] = [
+        sample_task(task, question)
+        for task, question in zip(results["task"], results["question"])
+    ]
+    counts = results.groupby(["model", "task", "question"])["refused"].agg(
+        ["size", "sum"]
+    )
+    return {key: [int(n), int(r)] for key, (n, r) in zip(counts.index, counts.values)}
+
+
 def check_thresholds(
-    logs_dir: Path, allowed: set[str] | None, min_scorable: float
+    stats: Counts, allowed: set[str] | None, min_scorable: float
 ) -> int:
     """Per-question scorable-rate admission gate (grouped by model, not dir).
 
@@ -101,27 +120,6 @@ def check_thresholds(
     question is caught even when the task average would scrape by. Returns the
     number of *ranked* models that fail (0 = the current allow-list is clean).
     """
-    # (model_short, task, question) -> [total, refused]
-    stats: dict[tuple[str, str, str], list[int]] = defaultdict(lambda: [0, 0])
-    for path in sorted(logs_dir.glob("**/*.eval")):
-        try:
-            log = read_eval_log(str(path))
-        except Exception as e:  # noqa: BLE001
-            print(f"  WARN: failed to read {path}: {e}")
-            continue
-        if log.status != "success" or not log.samples:
-            continue
-        if log.eval.task_args.get("language", "en") != "en":
-            continue  # rankings are the English assessment
-        model = log.eval.model.split("/")[-1]
-        # Early runs suffix the task name with "_task" (analysis.py strips it too).
-        task = log.eval.task_registry_name.split("/")[-1].removesuffix("_task")
-        for sample in log.samples:
-            key = (model, task, str(sample.id))
-            stats[key][0] += 1
-            if is_refusal(get_likert_score(sample)):
-                stats[key][1] += 1
-
     # model -> worst (task, question, rate, scorable, total); model -> tasks seen
     worst: dict[str, tuple[str, str, float, int, int]] = {}
     present: dict[str, set[str]] = defaultdict(set)
@@ -177,6 +175,34 @@ def check_thresholds(
     return len(failing)
 
 
+Totals = dict[str, list[int]]
+ByTask = dict[str, dict[str, int]]
+
+
+def scan_logs(logs_dir: Path, totals: Totals, by_task: ByTask, jobs: int = 1) -> None:
+    """Count per-epoch samples and refusals per log directory and task."""
+    eval_paths = sorted(logs_dir.glob("**/*.eval"))
+    print(f"Scanning {len(eval_paths)} .eval files...\n")
+
+    refusals = DirectoryRefusals()
+    _warn(scan(eval_paths, [refusals], jobs))
+    totals.update(refusals.totals)
+    by_task.update(refusals.by_task)
+
+
+def scan_store(store: Path, totals: Totals, by_task: ByTask) -> None:
+    """`scan_logs` from the results store (no logs are read)."""
+    results = read_results(store, columns=["log", "task", "language", "refused"])
+    print(f"Scanning {results['log'].nunique()} ingested logs...\n")
+    # Log directory, and the task name as the tasks register it.
+    results["dir"] = results["log"].map(lambda log: Path(log).parent.name)
+    results["task"] = results["task"] + "_" + results["language"]
+    for (model, task), refused in results.groupby(["dir", "task"])["refused"]:
+        totals[model][0] += len(refused)
+        totals[model][1] += int(refused.sum())
+        by_task[model][task] += int(refused.sum())
+
+
 def main() -> None:
     args = parse_args()
     logs_dir = Path(args.logs_dir)
@@ -187,34 +213,23 @@ def main() -> None:
 
     # Admission-gate mode: exit non-zero if any ranked model fails.
     if args.min_scorable is not None:
-        n_failing = check_thresholds(logs_dir, allowed, args.min_scorable)
+        stats = (
+            store_question_counts(Path(args.store))
+            if args.store
+            else question_counts(logs_dir, args.jobs)
+        )
+        n_failing = check_thresholds(stats, allowed, args.min_scorable)
         sys.exit(1 if n_failing else 0)
 
     # model -> [total_samples, refusals]
-    totals: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    totals: Totals = defaultdict(lambda: [0, 0])
     # model -> {task -> refusals} for detail
-    by_task: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-
-    eval_paths = sorted(logs_dir.glob("**/*.eval"))
-    print(f"Scanning {len(eval_paths)} .eval files...\n")
+    by_task: ByTask = defaultdict(lambda: defaultdict(int))
 
-    for path in eval_paths:
-        model = path.parent.name
-        try:
-            log = read_eval_log(str(path))
-        except Exception as e:  # noqa: BLE001
-            print(f"  WARN: failed to read {path}: {e}")
-            continue
-        if log.status != "success" or not log.samples:
-            continue
-
-        task = log.eval.task
-        for sample in log.samples:
-            score = get_likert_score(sample)
-            totals[model][0] += 1
-            if is_refusal(score):
-                totals[model][1] += 1
-                by_task[model][task] += 1
+    if args.store:
+        scan_store(Path(args.store), totals, by_task)
+    else:
+        scan_logs(logs_dir, totals, by_task, args.jobs)
 
     # Report
     rows = []
@@ -2,92 +2,137 @@
 
 Re-applies the `likert` scorer together with the refusal-excluding epoch
 reducer (`mean_valid`) and refusal-aware `mean`/`std` metrics to *stored* model
-outputs -- no model is ever called. Only `.eval` logs that contain at least one
-refusal are rewritten (all others already produce identical scores), and each
-affected model's `logs.json` manifest is regenerated so scripts/analysis.py
-picks up the corrected numbers.
+outputs with `specieval.offline.score_log` -- no model client is ever
+constructed, so no provider credentials are needed. Only `.eval` logs that
+contain at least one refusal are rewritten (all others already produce
+identical scores), and each affected model's `logs.json` manifest is updated
+(only the rewritten logs' entries are re-read, see
+`specieval.manifest.update_manifest`) and each rewritten log's summary sidecar
+refreshed, so scripts/analysis.py picks up the corrected numbers.
+Adaptive-epoch logs are re-scored from each epoch's recorded completion; those
+run without `retry_refusals` have no such record and are skipped with a
+warning.
 
 Scope is by model name (not directory): a log dir may hold several models and a
 model may span several dirs, so every English refusal log for a ranked model is
 re-scored wherever it lives. Non-English logs are left alone (language_analysis).
 
+Logs in scope are found with one `specieval.logscan` pass (headers and
+sample scores only, across --jobs processes); only those are then read in
+full and rewritten. With `--store`, the results store
+(`python -m specieval.results`) narrows that pass to the logs that contain
+refusals, so clean logs are never opened; logs the store has not ingested (or
+that changed since) are listed with a warning and scanned directly.
+
+Logs are re-scored in parallel (--jobs processes, largest first), each written
+to a temporary file and renamed over the original so a crash never leaves a
+half-written log. Finished logs are appended to a progress journal
+(<logs-dir>/.rescore-journal.jsonl); re-running after an interruption skips
+them, and the journal is removed once a run completes.
+
 Usage:
     python scripts/rescore.py                       # all ranked models w/ refusals
     python scripts/rescore.py --models gpt-5.1-chat # specific model name(s)
     python scripts/rescore.py --dry-run             # report, change nothing
+    python scripts/rescore.py --store results       # only open refusal logs
+    python scripts/rescore.py --restart             # ignore an interrupted run
 """
 
 import argparse
 import json
 import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import NamedTuple
+
+from inspect_ai.log import read_eval_log, write_eval_log
+from specieval.logscan import RescoreScope, scan
+from specieval.manifest import update_manifest
+from specieval.offline import MissingCompletionsError, score_log
+from specieval.results import read_catalog, read_results
+from specieval.sidecar import write_sidecar
+
+# Progress journal of a run in progress, at the root of the logs directory.
+JOURNAL_NAME = ".rescore-journal.jsonl"
+
 
-# Scoring re-constructs the model client (but never calls it); a placeholder
-# key is enough since every log routes through OpenRouter.
-os.environ.setdefault("OPENROUTER_API_KEY", "unused-during-rescore")
-
-from inspect_ai._eval.score import score as score_log  # noqa: E402
-from inspect_ai.log import (  # noqa: E402
-    read_eval_log,
-    write_eval_log,
-    write_log_dir_manifest,
-)
-from inspect_ai.scorer import NOANSWER  # noqa: E402
-from specieval.scorers.likert import likert  # noqa: E402
-from specieval.scorers.refusal import mean_valid  # noqa: E402
-
-
-def sample_is_refusal(sample) -> bool:
-    """True if a stored sample's likert score is a refusal / failed extraction."""
-    if not sample.scores:
-        return False
-    score = sample.scores.get("likert") or next(iter(sample.scores.values()))
-    value = score.value
-    if value == NOANSWER or isinstance(value, str):
-        return True
-    return bool(score.explanation and "Error extracting score" in score.explanation)
-
-
-def rescore_eval(
-    path: Path,
-    allowed: set[str],
-    models: list[str] | None,
-    dry_run: bool = False,
-) -> tuple[str, float | None, float | None] | None:
-    """Re-score a single .eval in place if it is an in-scope refusal log.
+class Rescored(NamedTuple):
+    """Outcome of re-scoring one log."""
+
+    model: str
+    old_mean: float
+    new_mean: float
+    seconds: float
+
+
+def rescore_eval(path: Path) -> Rescored:
+    """Re-score a single in-scope .eval in place, atomically.
 
     In scope = a successful English log for a ranked model that contains at
-    least one refusal. Log directories and model names are decoupled (a dir may
-    hold several models; a model may span several dirs), so scope is decided per
-    log by its own model/language, not by the directory name.
+    least one refusal, as found by `RescoreScope`. Log directories and model
+    names are decoupled (a dir may hold several models; a model may span
+    several dirs), so scope is decided per log by its own model/language, not
+    by the directory name.
 
-    Returns (model_short, old_mean, new_mean) when rewritten
-    (means are None in dry-run), else None.
+    The rescored log is written to a temporary file beside the original and
+    renamed over it, so an interrupted run never leaves a half-written log.
     """
+    start = time.perf_counter()
     log = read_eval_log(str(path))
-    if log.status != "success" or not log.samples:
-        return None
     model_short = log.eval.model.split("/")[-1]
-    target = models if models is not None else allowed
-    if model_short not in target:
-        return None
-    if log.eval.task_args.get("language", "en") != "en":
-        return None
-    if not any(sample_is_refusal(s) for s in log.samples):
-        return None
-
-    if dry_run:
-        return model_short, None, None
 
     old_mean = log.results.scores[0].metrics["mean"].value
 
-    # Clear header metrics so the passed scorer's refusal-aware mean/std are used
-    # (metrics_from_log_header would otherwise pin the old coercing metrics).
-    log.eval.metrics = None
-    rescored = score_log(log, likert(), epochs_reducer=mean_valid(), action="overwrite")
+    # Scored from the stored outputs; no model client is constructed.
+    rescored = score_log(log)
     new_mean = rescored.results.scores[0].metrics["mean"].value
-    write_eval_log(rescored, str(path))
-    return model_short, old_mean, new_mean
+
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        write_eval_log(rescored, str(tmp), format="eval")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    write_sidecar(rescored, path)
+    return Rescored(model_short, old_mean, new_mean, time.perf_counter() - start)
+
+
+def _stat(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def read_journal(journal: Path) -> dict[str, dict]:
+    """Logs a previous, interrupted run re-scored: relative path -> entry.
+
+    Each entry records the log's size and mtime once rewritten; a torn last
+    line (from a crash mid-write) is ignored.
+    """
+    entries: dict[str, dict] = {}
+    try:
+        lines = journal.read_text().splitlines()
+    except FileNotFoundError:
+        return entries
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        entries[entry["log"]] = entry
+    return entries
+
+
+def _journaled(entry: dict | None, path: Path) -> bool:
+    """Whether `path` is still exactly as a journaled re-score left it."""
+    return entry is not None and (entry["size"], entry["mtime_ns"]) == _stat(path)
+
+
+def _task_label(path: Path) -> str:
+    parts = path.name.split("_")
+    return parts[1] if len(parts) > 1 else path.name
 
 
 def main() -> None:
@@ -101,41 +146,159 @@ def main() -> None:
     ap.add_argument(
         "--dry-run", action="store_true", help="Report changes without writing"
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes scanning and re-scoring logs (default: one per CPU)",
+    )
+    ap.add_argument(
+        "--journal",
+        help="Progress journal for resuming an interrupted run "
+        f"(default: <logs-dir>/{JOURNAL_NAME})",
+    )
+    ap.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the progress journal of an interrupted run",
+    )
+    ap.add_argument(
+        "--store",
+        help="Results store to pick the English logs with refusals from "
+        "(default: open every log)",
+    )
     args = ap.parse_args()
 
     logs_dir = Path(args.logs_dir)
+    journal = Path(args.journal) if args.journal else logs_dir / JOURNAL_NAME
     # Ranked models (published table). Scope is by model name, not directory:
     # a dir can hold several models and a model can span several dirs.
     allowed = set(json.load(open(Path(__file__).parent / "allowed_models.json")))
 
-    total_changed = 0
+    # Logs (relative to logs_dir) that the store says hold refusals, and the
+    # (size, mtime) of every log it has ingested.
+    candidates = None
+    ingested: dict[str, tuple[int, float]] = {}
+    if args.store:
+        results = read_results(
+            args.store,
+            columns=["log", "refused"],
+            filters=[("language", "=", "en"), ("refused", "=", True)],
+        )
+        candidates = set(results["log"])
+        ingested = {
+            path: (entry["size"], entry["mtime"])
+            for path, entry in read_catalog(Path(args.store)).items()
+        }
+
+    eval_paths = []
+    unknown = []
     for model_dir in sorted(p.parent for p in logs_dir.glob("*/logs.json")):
-        changed = []  # (task_label, model_short, old_mean, new_mean)
         for eval_path in sorted(model_dir.glob("*.eval")):
-            result = rescore_eval(eval_path, allowed, args.models, dry_run=args.dry_run)
-            if result is not None:
-                parts = eval_path.name.split("_")
-                changed.append(
-                    (parts[1] if len(parts) > 1 else eval_path.name, *result)
-                )
-
-        if not changed:
-            continue
+            relative_path = eval_path.relative_to(logs_dir).as_posix()
+            if candidates is None or relative_path in candidates:
+                eval_paths.append(eval_path)
+                continue
+            stat = eval_path.stat()
+            if ingested.get(relative_path) != (stat.st_size, stat.st_mtime):
+                # New or changed since the store was ingested: scan it directly.
+                unknown.append(relative_path)
+                eval_paths.append(eval_path)
+    if unknown:
+        print(
+            f"  WARN: {len(unknown)} log(s) missing from or changed since the "
+            f"store {args.store}, scanning them directly "
+            "(update it with `python -m specieval.results`):"
+        )
+        for relative_path in unknown:
+            print(f"    {relative_path}")
 
-        total_changed += len(changed)
-        print(f"\n{model_dir.name}/:")
-        for task, model_short, old, new in changed:
-            if old is None:
-                print(f"  {model_short} {task}: (dry-run) has refusals")
-            else:
-                print(f"  {model_short} {task}: mean {old:.3f} -> {new:.3f}")
+    # One pass over headers and sample scores finds the logs to rewrite.
+    scope = RescoreScope(args.models if args.models is not None else allowed)
+    for path, e in scan(eval_paths, [scope], args.jobs):
+        print(f"  WARN: failed to read {path}: {e}")
 
-        if not args.dry_run:
-            write_log_dir_manifest(str(model_dir))
-            print("  regenerated logs.json manifest")
+    if args.dry_run:
+        in_scope = defaultdict(list)
+        for path, model_short in scope.paths.items():
+            in_scope[path.parent].append((path, model_short))
+        for model_dir, paths in in_scope.items():
+            print(f"\n{model_dir.name}/:")
+            for path, model_short in paths:
+                print(f"  {model_short} {_task_label(path)}: (dry-run) has refusals")
+        print(
+            f"\nDone. would re-score {len(scope.paths)} log(s) across affected models."
+        )
+        return
 
-    verb = "would re-score" if args.dry_run else "re-scored"
-    print(f"\nDone. {verb} {total_changed} log(s) across affected models.")
+    if args.restart:
+        journal.unlink(missing_ok=True)
+    done = read_journal(journal)
+    todo = [
+        path
+        for path in scope.paths
+        if not _journaled(done.get(path.relative_to(logs_dir).as_posix()), path)
+    ]
+    # Largest logs first, so the pool is not left waiting on one at the end.
+    todo.sort(key=lambda path: path.stat().st_size, reverse=True)
+    resumed = len(scope.paths) - len(todo)
+    if resumed:
+        print(f"Resuming: {resumed} log(s) already re-scored per {journal}")
+    print(f"Re-scoring {len(todo)} log(s) across {args.jobs} process(es)...\n")
+
+    start = time.perf_counter()
+    failed = []
+    skipped = []
+    with (
+        ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(todo)))) as pool,
+        open(journal, "a") as journal_file,
+    ):
+        futures = {pool.submit(rescore_eval, path): path for path in todo}
+        for future in as_completed(futures):
+            path = futures[future]
+            relative_path = path.relative_to(logs_dir).as_posix()
+            try:
+                result = future.result()
+            except MissingCompletionsError as e:
+                print(f"  SKIP {relative_path}: {e}")
+                skipped.append(path)
+                continue
+            except Exception as e:  # noqa: BLE001
+                print(f"  FAIL {relative_path}: {e}")
+                failed.append(path)
+                continue
+            size, mtime_ns = _stat(path)
+            entry = {"log": relative_path, "size": size, "mtime_ns": mtime_ns}
+            journal_file.write(json.dumps({**entry, **result._asdict()}) + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+            print(
+                f"  {relative_path}: {result.model} {_task_label(path)}: mean "
+                f"{result.old_mean:.3f} -> {result.new_mean:.3f} "
+                f"({result.seconds:.2f}s)"
+            )
+
+    # Every directory with a re-scored log, this run or an interrupted one.
+    rescored = [p for p in scope.paths if p not in failed and p not in skipped]
+    print()
+    for model_dir in sorted({path.parent for path in rescored}):
+        update = update_manifest(model_dir)
+        print(f"{model_dir.name}/: updated logs.json manifest ({update.read} read)")
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"\nDone. re-scored {len(todo) - len(failed) - len(skipped)} log(s) "
+        f"in {elapsed:.1f}s"
+        + (f" ({resumed} resumed)" if resumed else "")
+        + (f"; {len(skipped)} skipped" if skipped else "")
+        + (f"; {len(failed)} failed" if failed else "")
+        + "."
+    )
+    if failed:
+        print(f"Re-run to retry the failed logs (progress kept in {journal}).")
+        sys.exit(1)
+    # Complete: a later run (e.g. after a scorer change) starts afresh.
+    journal.unlink(missing_ok=True)
 
 
 if __name__ == "__main__":
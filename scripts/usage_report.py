@@ -0,0 +1,112 @@
+"""Report token usage and prompt-cache hits for SpeciEval logs.
+
+Reads only log headers (no samples) and prints, per model and task, the input
+tokens sent, how many of them were served from the provider's prompt cache
+(`input_tokens_cache_read`) or written to it, and the output tokens. Use it to
+confirm that `-T cache_prompt=true` actually reduces billed input tokens.
+
+With `--attempts` it also reads the samples and reports the per-attempt token
+usage that `generate_until_answered` records, to compare `-T retry_history`
+settings: first attempts versus re-prompts, and input tokens per re-prompt.
+
+Usage:
+    python scripts/usage_report.py                  # every log under logs/
+    python scripts/usage_report.py --logs-dir rerun-stage
+    python scripts/usage_report.py --attempts
+"""
+
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+from inspect_ai.log import read_eval_log
+from specieval.solvers.retry import ATTEMPTS_KEY
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Token usage / prompt-cache report")
+    p.add_argument("--logs-dir", default="logs")
+    p.add_argument(
+        "--attempts",
+        action="store_true",
+        help="Also report per-attempt retry token usage (reads samples)",
+    )
+    return p.parse_args()
+
+
+def attempts_report(paths: list[Path]) -> None:
+    """Print first-attempt vs re-prompt counts and input tokens per model/task."""
+    # (model, task) -> [first attempts, first input, re-prompts, re-prompt input]
+    usage: dict[tuple[str, str], list[int]] = defaultdict(lambda: [0, 0, 0, 0])
+    for path in paths:
+        try:
+            log = read_eval_log(str(path))
+        except Exception as e:  # noqa: BLE001
+            print(f"  WARN: failed to read {path}: {e}")
+            continue
+        key = (log.eval.model.split("/")[-1], log.eval.task.split("/")[-1])
+        for sample in log.samples or []:
+            for a in sample.store.get(ATTEMPTS_KEY, []):
+                i = 0 if a["attempt"] == 1 else 2
+                usage[key][i] += 1
+                usage[key][i + 1] += a["input_tokens"] or 0
+
+    if not usage:
+        print("No attempt records found.")
+        return
+    print(
+        f"{'model':<28} {'task':<24} {'first':>8} {'in/first':>10} "
+        f"{'retries':>8} {'in/retry':>10}"
+    )
+    print("-" * 93)
+    for (model, task), (first, first_in, retries, retry_in) in sorted(usage.items()):
+        per_first = first_in / first if first else 0
+        per_retry = retry_in / retries if retries else 0
+        print(
+            f"{model:<28} {task:<24} {first:>8} {per_first:>10.0f} "
+            f"{retries:>8} {per_retry:>10.0f}"
+        )
+
+
+def main() -> None:
+    args = parse_args()
+    logs_dir = Path(args.logs_dir)
+
+    # (model, task) -> [input, cache_read, cache_write, output]
+    usage: dict[tuple[str, str], list[int]] = defaultdict(lambda: [0, 0, 0, 0])
+    paths = sorted(logs_dir.glob("**/*.eval"))
+    for path in paths:
+        try:
+            log = read_eval_log(str(path), header_only=True)
+        except Exception as e:  # noqa: BLE001
+            print(f"  WARN: failed to read {path}: {e}")
+            continue
+        task = log.eval.task.split("/")[-1]
+        for model, u in log.stats.model_usage.items():
+            totals = usage[(model.split("/")[-1], task)]
+            totals[0] += u.input_tokens
+            totals[1] += u.input_tokens_cache_read or 0
+            totals[2] += u.input_tokens_cache_write or 0
+            totals[3] += u.output_tokens
+
+    if not usage:
+        print("No logs found.")
+        return
+
+    # Providers differ on whether input_tokens includes the cached tokens, so
+    # the raw counts are reported rather than a derived hit rate.
+    print(
+        f"{'model':<28} {'task':<24} {'input':>10} {'cache rd':>10} "
+        f"{'cache wr':>10} {'output':>10}"
+    )
+    print("-" * 97)
+    for (model, task), (inp, read, write, out) in sorted(usage.items()):
+        print(f"{model:<28} {task:<24} {inp:>10} {read:>10} {write:>10} {out:>10}")
+
+    if args.attempts:
+        print()
+        attempts_report(paths)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Bootstrap confidence intervals for SpeciEval scores.
+
+Scores are held as a NaN-padded matrix of per-epoch values, one row per
+question (or a stack of such matrices, one per model), built by `epoch_matrix`.
+Refused epochs are dropped before resampling, exactly as `mean_valid` excludes
+them, and a question with no scorable epoch is excluded from the overall mean,
+as the `mean` metric does.
+
+Every function draws all of its resamples at once with a seeded numpy
+`Generator`, so results are reproducible and there is no Python loop over
+resamples:
+
+- `bootstrap_means` resamples questions and, within each, epochs (a two-stage
+  bootstrap of the task mean);
+- `composite_bootstrap` resamples the epochs of every composite question for a
+  whole models x questions x epochs array, giving composite replicates for
+  every model in one draw, which `rank_intervals` turns into rank intervals.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from specieval.composite import COMPOSITE_QUESTIONS, reverse_mask
+
+DEFAULT_RESAMPLES = 1000
+DEFAULT_SEED = 0
+
+
+def epoch_matrix(epochs: Sequence[Sequence[float]]) -> np.ndarray:
+    """Stack per-question epoch values into a (questions, epochs) array.
+
+    Refusals (NaN) are dropped and each row's scorable values packed to the
+    left, padded with NaN to the longest row.
+
+    Args:
+        epochs: Each question's epoch values, with refusals as NaN.
+    """
+    rows = [[v for v in values if not np.isnan(v)] for values in epochs]
+    matrix = np.full((len(rows), max(map(len, rows), default=0)), np.nan)
+    for i, row in enumerate(rows):
+        matrix[i, : len(row)] = row
+    return matrix
+
+
+def _resample_epochs(
+    values: np.ndarray, resamples: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Resampled epoch means of every question in `values` (..., epochs).
+
+    `values` is packed as by `epoch_matrix`; each question redraws as many
+    scorable epochs as it has, with replacement. Returns (resamples, ...)
+    means, NaN for questions with no scorable epoch.
+    """
+    count = (~np.isnan(values)).sum(axis=-1)
+    draws = rng.random((resamples, *values.shape)) * count[..., None]
+    index = draws.astype(np.intp)
+    drawn = np.take_along_axis(values[None], index, axis=-1)
+    drawn = np.where(np.arange(values.shape[-1]) < count[..., None], drawn, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return drawn.sum(axis=-1) / count
+
+
+def bootstrap_means(
+    matrix: np.ndarray,
+    resamples: int = DEFAULT_RESAMPLES,
+    seed: int | None = DEFAULT_SEED,
+) -> np.ndarray:
+    """Bootstrap replicates of the mean over questions of each question's mean.
+
+    Args:
+        matrix: (questions, epochs) values from `epoch_matrix`.
+        resamples: Number of bootstrap replicates.
+        seed: RNG seed.
+
+    Returns:
+        (resamples,) replicate means, all NaN if no question is scorable.
+    """
+    rng = np.random.default_rng(seed)
+    # Fully-refused questions are excluded, as by the `mean` metric.
+    matrix = matrix[~np.isnan(matrix).all(axis=-1)]
+    questions = matrix.shape[0]
+    if questions == 0:
+        return np.full(resamples, np.nan)
+    picked = matrix[rng.integers(0, questions, (resamples, questions))]
+    return _resample_epochs(picked, 1, rng)[0].mean(axis=-1)
+
+
+def percentile_interval(
+    replicates: np.ndarray, level: float = 0.95, axis: int = 0
+) -> np.ndarray:
+    """(lower, upper) percentile interval of `replicates`, ignoring NaN."""
+    tail = 100 * (1 - level) / 2
+    if np.isnan(replicates).all():
+        shape = np.delete(replicates.shape, axis)
+        return np.full((2, *shape), np.nan)
+    return np.nanpercentile(replicates, [tail, 100 - tail], axis=axis)
+
+
+def composite_bootstrap(
+    values: np.ndarray,
+    questions: Sequence[str] = COMPOSITE_QUESTIONS,
+    levels: int = 7,
+    resamples: int = DEFAULT_RESAMPLES,
+    seed: int | None = DEFAULT_SEED,
+) -> np.ndarray:
+    """Bootstrap replicates of the composite score for a whole model matrix.
+
+    The composite's questions are fixed, so only their epochs are resampled.
+    As in `composite_score`, a model's replicates are NaN if any question has
+    no scorable epoch.
+
+    Args:
+        values: (models, questions, epochs) values in `questions` order, each
+            model's matrix packed as by `epoch_matrix`.
+        questions: Question IDs along the second axis.
+        levels: Number of Likert levels.
+        resamples: Number of bootstrap replicates.
+        seed: RNG seed.
+
+    Returns:
+        (resamples, models) composite replicates on the 0-100 scale.
+    """
+    rng = np.random.default_rng(seed)
+    means = _resample_epochs(values, resamples, rng)
+    reverse = np.array(reverse_mask(questions), dtype=bool)
+    means = np.where(reverse, levels + 1 - means, means)
+    n = len(questions)
+    return 100 * (means.sum(axis=-1) - n) / (levels * n - n)
+
+
+def rank_intervals(replicates: np.ndarray, level: float = 0.95) -> np.ndarray:
+    """Per-model rank intervals from (resamples, models) score replicates.
+
+    Rank 1 is the highest score; NaN replicates rank last.
+
+    Returns:
+        (2, models) lower and upper ranks, widened to whole ranks.
+    """
+    order = np.argsort(-replicates, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, order.shape[1] + 1), axis=1)
+    lower, upper = percentile_interval(ranks.astype(float), level)
+    return np.stack([np.floor(lower), np.ceil(upper)]).astype(int)
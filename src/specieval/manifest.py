@@ -0,0 +1,231 @@
+"""Streaming reader for `logs.json` log directory manifests.
+
+A manifest maps each log file name to that log's header and sample
+reductions. `read_manifest` parses it incrementally with ijson and yields one
+`ManifestLog` per log holding only the fields the analysis scripts use, so the
+whole document (plans, stats, explanations, score histories) is never built
+in memory and peak memory stays flat however large the archive grows.
+
+Only the first score and the first reduction of each log are kept, as the
+analysis scripts only ever read those.
+
+`update_manifest` keeps a manifest up to date incrementally: an index beside it
+(`logs.index.json`) records each log's size, mtime and content hash, so only
+the headers of new or changed logs are read, and the manifest is replaced
+atomically.
+"""
+
+import json
+import math
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+MANIFEST_NAME = "logs.json"
+# Name, size, mtime and SHA-256 of each log in the manifest. Not a log name
+# (no date prefix), so Inspect never lists it.
+INDEX_NAME = "logs.index.json"
+
+
+class ManifestSample(NamedTuple):
+    """A sample's epoch-reduced score."""
+
+    sample_id: str | None
+    value: Any
+    """Reduced value (a number, or NOANSWER for a fully-refused question)."""
+    epoch_values: list[Any] | None
+    """Per-epoch values recorded by `mean_valid`, if any."""
+
+
+class ManifestLog(NamedTuple):
+    """The fields of one manifest entry the analysis scripts use."""
+
+    name: str
+    status: str | None
+    model: str | None
+    task_registry_name: str | None
+    language: str | None
+    """The `language` task argument, if given."""
+    metrics: dict[str, float]
+    """Metric name -> value of the first score."""
+    samples: list[ManifestSample]
+    """Sample reductions of the first reducer."""
+
+
+# Scalar fields, by path within a log entry.
+_FIELDS = {
+    "status": "status",
+    "eval.model": "model",
+    "eval.task_registry_name": "task_registry_name",
+    "eval.task_args.language": "language",
+}
+_SCALARS = {"string", "number", "boolean", "null"}
+_METRICS = "results.scores.item.metrics."
+_SAMPLE = "reductions.item.samples.item"
+
+
+class _Entry:
+    """Accumulates one log entry's fields from parser events."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.fields: dict[str, Any] = {}
+        self.metrics: dict[str, float] = {}
+        self.samples: list[ManifestSample] = []
+        self.scores = 0
+        self.reductions = 0
+        self.sample: dict[str, Any] = {}
+
+    def event(self, path: str, event: str, value: Any) -> None:
+        if event == "start_map":
+            if path == "results.scores.item":
+                self.scores += 1
+            elif path == "reductions.item":
+                self.reductions += 1
+            elif path == _SAMPLE and self.reductions == 1:
+                self.sample = {"epoch_values": None}
+        elif event == "end_map":
+            if path == _SAMPLE and self.reductions == 1:
+                sample_id = self.sample.get("sample_id")
+                self.samples.append(
+                    ManifestSample(
+                        None if sample_id is None else str(sample_id),
+                        self.sample.get("value", math.nan),
+                        self.sample["epoch_values"],
+                    )
+                )
+        elif path.startswith(_SAMPLE):
+            if self.reductions != 1:
+                return
+            field = path[len(_SAMPLE) + 1 :]
+            if field in ("sample_id", "value") and event in _SCALARS:
+                self.sample[field] = value
+            elif field == "metadata.epoch_values" and event == "start_array":
+                self.sample["epoch_values"] = []
+            elif field == "metadata.epoch_values.item" and event in _SCALARS:
+                self.sample["epoch_values"].append(value)
+        elif path.startswith(_METRICS) and path.endswith(".value"):
+            if self.scores == 1 and event == "number":
+                self.metrics[path[len(_METRICS) : -len(".value")]] = value
+        elif path in _FIELDS and event in _SCALARS:
+            self.fields[_FIELDS[path]] = value
+
+    def log(self) -> ManifestLog:
+        return ManifestLog(
+            name=self.name,
+            status=self.fields.get("status"),
+            model=self.fields.get("model"),
+            task_registry_name=self.fields.get("task_registry_name"),
+            language=self.fields.get("language"),
+            metrics=self.metrics,
+            samples=self.samples,
+        )
+
+
+def read_manifest(path: Path | str) -> Iterator[ManifestLog]:
+    """Yield each log of a `logs.json` manifest, parsing it incrementally.
+
+    Raises:
+        ijson.JSONError: If the manifest is not valid JSON (logs already
+            yielded are unaffected).
+    """
+    import ijson
+
+    entry: _Entry | None = None
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "":
+                # Top-level map: each key is a log file name (which may itself
+                # contain dots, so it is tracked here rather than split out of
+                # the prefix).
+                if event == "map_key":
+                    if entry is not None:
+                        yield entry.log()
+                    entry = _Entry(value)
+                continue
+            if entry is not None and prefix != entry.name:
+                entry.event(prefix[len(entry.name) + 1 :], event, value)
+    if entry is not None:
+        yield entry.log()
+
+
+class ManifestUpdate(NamedTuple):
+    """What an `update_manifest` run did, in logs."""
+
+    read: int
+    """Logs whose header was (re-)read: new, changed, or not yet indexed."""
+    unchanged: int
+    removed: int
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def update_manifest(log_dir: Path | str, full: bool = False) -> ManifestUpdate:
+    """Bring a log directory's `logs.json` up to date, reading only what changed.
+
+    Produces the same manifest as Inspect's `write_log_dir_manifest`, but only
+    reads the headers of logs that are new or whose contents changed (by size
+    and mtime, then by hash); entries of unchanged logs are carried over and
+    those of deleted logs dropped. The manifest and its index are each written
+    to a temporary file and renamed into place.
+
+    Args:
+        log_dir: Log directory (local).
+        full: Ignore the index and re-read every header.
+    """
+    from inspect_ai.log import list_eval_logs, read_eval_log
+    from pydantic_core import to_json
+
+    from specieval.results import file_sha256
+
+    log_dir = Path(log_dir).resolve()
+    manifest_path = log_dir / MANIFEST_NAME
+    index_path = log_dir / INDEX_NAME
+    manifest: dict[str, Any] = {}
+    index: dict[str, dict[str, Any]] = {}
+    if not full:
+        try:
+            manifest = json.loads(manifest_path.read_bytes())
+            index = json.loads(index_path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            manifest, index = {}, {}
+
+    entries: dict[str, Any] = {}
+    new_index: dict[str, dict[str, Any]] = {}
+    read = unchanged = 0
+    # Newest first, as Inspect orders manifests.
+    for info in list_eval_logs(str(log_dir)):
+        path = Path(info.name.removeprefix("file://"))
+        name = path.relative_to(log_dir).as_posix()
+        stat = path.stat()
+        entry = index.get(name) if name in manifest else None
+        if entry and (entry["size"], entry["mtime_ns"]) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            entries[name], new_index[name] = manifest[name], entry
+            unchanged += 1
+            continue
+        sha256 = file_sha256(path)
+        if entry and entry["sha256"] == sha256:
+            # Touched or copied, but the same contents.
+            entries[name] = manifest[name]
+            unchanged += 1
+        else:
+            entries[name] = read_eval_log(str(path), header_only=True)
+            read += 1
+        new_index[name] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+        }
+
+    removed = sum(name not in entries for name in manifest)
+    _write_atomic(manifest_path, to_json(entries, indent=2, exclude_none=True))
+    _write_atomic(index_path, json.dumps(new_index, indent=1).encode())
+    return ManifestUpdate(read, unchanged, removed)
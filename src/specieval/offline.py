@@ -0,0 +1,269 @@
+"""Offline scoring of stored SpeciEval samples.
+
+`score_log` re-applies the `likert` scorer (`likert_epochs` for adaptive-epoch
+logs), the refusal-excluding `mean_valid` epoch reducer and the refusal-aware
+`mean`/`std`/`bootstrap_ci` metrics -- plus the grouped and composite metrics
+of the task that wrote the log (`task_metrics`) -- to the samples of an
+existing log and replaces its scores, reductions and results. It is what
+Inspect's `score()` with `action="overwrite"` would produce for these scorers,
+but built only on the stored outputs: no model client is constructed (so no
+provider SDK or API key is needed) and the eval runtime is never entered.
+
+An adaptive-epoch sample keeps only its last epoch as its output, so its
+epochs are re-scored from the final completions in its attempt records
+(`epoch_completions`) before `likert_epochs` reduces them.
+
+scripts/rescore.py uses it to re-score logs in place.
+"""
+
+import asyncio
+import math
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any, cast
+
+from inspect_ai.log import (
+    EvalLog,
+    EvalMetric,
+    EvalResults,
+    EvalSample,
+    EvalSampleReductions,
+    EvalSampleScore,
+    EvalScore,
+)
+from inspect_ai.model import ModelName, ModelOutput
+from inspect_ai.scorer import (
+    NOANSWER,
+    Metric,
+    SampleScore,
+    Score,
+    Scorer,
+    Target,
+    Value,
+    grouped,
+)
+from inspect_ai.solver import TaskState
+from inspect_ai.util import registry_info
+
+from specieval.scorers.bootstrap import bootstrap_ci
+from specieval.scorers.composite import composite
+from specieval.scorers.likert import EPOCH_SCORES_KEY, likert, likert_epochs
+from specieval.scorers.refusal import mean, mean_valid, std
+from specieval.solvers.retry import ATTEMPTS_KEY
+
+REDUCER_NAME = "mean_valid"
+
+
+class MissingCompletionsError(ValueError):
+    """Raised when an adaptive-epoch sample has no record of some epoch."""
+
+
+def scorer_name(log: EvalLog) -> str:
+    """Name of the scorer `score_log` applies to `log`."""
+    return "likert_epochs" if log.eval.task_args.get("adaptive") else "likert"
+
+
+def task_metrics(log: EvalLog) -> list[Metric]:
+    """The metrics of the task that wrote `log`, as the tasks define them."""
+    metrics = [mean(), std(), bootstrap_ci()]
+    task = log.eval.task_registry_name
+    if task == "specieval/specieval_all":
+        metrics += [grouped(mean(), "assessment", all=False), composite()]
+    elif task == "specieval/specieval_sweep":
+        metrics += [
+            grouped(mean(), "language", all=False),
+            grouped(mean(), "assessment", all=False),
+        ]
+    return metrics
+
+
+def epoch_completions(sample: EvalSample) -> list[str] | None:
+    """Final completion of each epoch of an adaptive-epoch sample.
+
+    Read from the sample's attempt records; None if some epoch has none, as
+    when the task ran without `retry_refusals`.
+    """
+    final: dict[int, str] = {}
+    for attempt in sample.store.get(ATTEMPTS_KEY, []):
+        final[attempt["epoch"]] = attempt["completion"]
+    epochs = range(1, len(sample.store.get(EPOCH_SCORES_KEY, [])) + 1)
+    if sorted(final) != list(epochs):
+        return None
+    return [final[epoch] for epoch in epochs]
+
+
+async def _score_sample(
+    scorer: Scorer,
+    log: EvalLog,
+    sample: EvalSample,
+    output: ModelOutput | None = None,
+) -> Score:
+    target = Target(sample.target)
+    state = TaskState(
+        model=ModelName(log.eval.model),
+        sample_id=sample.id,
+        epoch=sample.epoch,
+        input=sample.input,
+        messages=sample.messages,
+        target=target,
+        choices=sample.choices,
+        output=output or sample.output,
+        completed=True,
+        metadata=sample.metadata,
+        store=sample.store,
+        sample_uuid=sample.uuid,
+    )
+    score = await scorer(state, target)
+    return score if score is not None else Score(value=NOANSWER)
+
+
+def _metric_values(
+    metrics: list[Metric],
+    scores: list[SampleScore],
+    previous: dict[str, EvalMetric],
+) -> dict[str, EvalMetric]:
+    """Evaluate `metrics` as Inspect reports them, expanding dict values.
+
+    Metric params are carried over from the `previous` results, which the
+    same task metrics produced.
+    """
+    values: dict[str, EvalMetric] = {}
+
+    def add(key: str, name: str, value: Any) -> None:
+        params = previous[key].params if key in previous else {}
+        values[key] = EvalMetric(name=name, value=float(value), params=params)
+
+    for metric in metrics:
+        # Inspect's own metrics are logged without their package prefix.
+        name = registry_info(metric).name.removeprefix("inspect_ai/")
+        fn = cast(Callable[[list[SampleScore]], Value], metric)
+        value = fn(scores) if scores else math.nan
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if item is not None:
+                    add(key, key, item)
+        else:
+            add(name.split("/")[-1], name, value)
+    return values
+
+
+def score_log(log: EvalLog) -> EvalLog:
+    """Re-score a (fully read) SpeciEval log from its stored outputs, in place.
+
+    Each sample's scores are replaced by the scorer's (as is the score in its
+    transcript), the samples are reduced across epochs with `mean_valid`, and
+    the results are recomputed with the task's metrics (`task_metrics`). The
+    metric definitions recorded in the header are dropped, as older logs list
+    Inspect's refusal-coercing `mean`/`std` there.
+
+    Adaptive-epoch samples have the per-epoch scores in their store replaced
+    by `likert` scores of the epochs' final completions (`epoch_completions`),
+    which `likert_epochs` then reduces.
+
+    Returns:
+        The same log, re-scored.
+
+    Raises:
+        ValueError: If the log has no samples.
+        MissingCompletionsError: If an adaptive-epoch sample has no recorded
+            completion for some epoch.
+    """
+    if log.samples is None:
+        raise ValueError("There are no samples to score in the log.")
+    name = scorer_name(log)
+    scorer = likert_epochs() if name == "likert_epochs" else likert()
+    completions = []
+    if name == "likert_epochs":
+        completions = [epoch_completions(s) for s in log.samples]
+        missing = [str(s.id) for s, c in zip(log.samples, completions) if c is None]
+        if missing:
+            raise MissingCompletionsError(
+                "No recorded completion for some adaptive epoch of sample(s) "
+                f"{', '.join(missing)}; only logs run with retry_refusals > 0 "
+                "record every epoch."
+            )
+
+    epoch_scorer = likert()
+
+    async def score_epochs(sample: EvalSample, epochs: list[str]) -> None:
+        scores = [
+            await _score_sample(
+                epoch_scorer,
+                log,
+                sample,
+                ModelOutput.from_content(model=log.eval.model, content=completion),
+            )
+            for completion in epochs
+        ]
+        sample.store[EPOCH_SCORES_KEY] = [s.model_dump(mode="json") for s in scores]
+
+    async def score_all() -> list[Score]:
+        for sample, epochs in zip(log.samples or [], completions):
+            await score_epochs(sample, cast(list[str], epochs))
+        return [await _score_sample(scorer, log, s) for s in log.samples or []]
+
+    scores = asyncio.run(score_all())
+
+    by_sample: dict[str, list[SampleScore]] = defaultdict(list)
+    for sample, score in zip(log.samples, scores):
+        sample.scores = {name: score}
+        for event in sample.events:
+            if event.event == "score" and not event.intermediate:
+                event.score = score
+        by_sample[str(sample.id)].append(
+            SampleScore(
+                score=score,
+                sample_id=sample.id,
+                sample_metadata=sample.metadata,
+                scorer=name,
+            )
+        )
+
+    reduce = mean_valid(epoch_values=True)
+    reduced = [
+        SampleScore(
+            score=reduce([s.score for s in epochs]),
+            sample_id=epochs[0].sample_id,
+            sample_metadata=epochs[0].sample_metadata,
+        )
+        for epochs in by_sample.values()
+    ]
+    # Samples reduced to NaN go unscored; NOANSWER ones are left to the metrics.
+    scored = [
+        s
+        for s in reduced
+        if not (isinstance(s.score.value, float) and math.isnan(s.score.value))
+    ]
+
+    previous = (
+        log.results.scores[0].metrics if log.results and log.results.scores else {}
+    )
+    log.eval.metrics = None
+    log.eval.config.epochs_reducer = [REDUCER_NAME]
+    log.reductions = [
+        EvalSampleReductions(
+            scorer=name,
+            reducer=REDUCER_NAME,
+            samples=[
+                EvalSampleScore(**s.score.__dict__, sample_id=s.sample_id)
+                for s in reduced
+            ],
+        )
+    ]
+    log.results = EvalResults(
+        total_samples=len(log.samples),
+        completed_samples=len(log.samples),
+        early_stopping=log.results.early_stopping if log.results else None,
+        scores=[
+            EvalScore(
+                name=name,
+                scorer=name,
+                reducer=REDUCER_NAME,
+                scored_samples=len(scored),
+                unscored_samples=len(reduced) - len(scored),
+                params={},
+                metrics=_metric_values(task_metrics(log), scored, previous),
+            )
+        ],
+    )
+    return log
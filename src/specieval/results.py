@@ -0,0 +1,393 @@
+"""Columnar results store built once from the SpeciEval logs.
+
+`python -m specieval.results` flattens every successful `.eval` log under a
+logs directory into a Parquet dataset with one row per sample x epoch,
+partitioned by model, task and language (`model=.../task=.../language=...`,
+one file per log and partition). The analysis scripts read that dataset with
+`read_results` instead of decoding JSON manifests or full logs on every run.
+
+Ingestion is incremental: a catalog (`_catalog.json`) records each log's size,
+mtime, content hash and header fields, so a refresh only reads new or changed
+logs and drops the rows of deleted ones.
+
+Columns (besides the `model`, `task` and `language` partitions):
+
+- log: log path, relative to the logs directory
+- sample_id, question, assessment: sample ID as logged, and its question ID
+  (early "am_"/"asf_" IDs normalized to "la4N_"/"se4N_") and assessment
+- epoch: epoch number (the internal epoch for adaptive-epoch samples)
+- answer: raw "ANSWER: N" value of the final completion, null if none (or
+  too large to store; such an answer is out of range and refused anyway)
+- score: final score, NaN when refused
+- refused: whether the epoch was a refusal (NOANSWER)
+- attempts: generations made for the epoch, including re-prompts
+- input_tokens, output_tokens: tokens used by the epoch's generations
+- latency: seconds the sample took (NaN for the internal epochs of an
+  adaptive-epoch sample, which share one sample)
+
+Usage:
+    python -m specieval.results                       # logs/ -> results/
+    python -m specieval.results --logs-dir logs --store results
+    python -m specieval.results --full                # rebuild from scratch
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import os
+import shutil
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import pandas as pd
+from inspect_ai.log import EvalLog, EvalSample, read_eval_log
+
+from specieval.assessments import assessment_for, parse_sample_id
+from specieval.extract import extract_answers
+from specieval.scorers.refusal import _is_refusal
+from specieval.solvers.retry import ATTEMPTS_KEY
+
+logger = logging.getLogger(__name__)
+
+PARTITIONS = ["model", "task", "language"]
+
+# Catalog of ingested logs, at the store root ("_" keeps it out of the dataset).
+CATALOG_NAME = "_catalog.json"
+
+# Early runs named the meat/seafood questions am_*/asf_*; they are the same
+# questions as la4N_*/se4N_*.
+_RENAMED_PREFIXES = (("am_", "la4N_"), ("asf_", "se4N_"))
+
+_COLUMNS = {
+    "log": "string",
+    "sample_id": "string",
+    "question": "string",
+    "assessment": "string",
+    "epoch": "int64",
+    "answer": "Int64",
+    "score": "float64",
+    "refused": "bool",
+    "attempts": "int64",
+    "input_tokens": "Int64",
+    "output_tokens": "Int64",
+    "latency": "float64",
+}
+
+
+def normalize_question(question: str) -> str:
+    """Question ID under its current name ("am_1" -> "la4N_1")."""
+    for old, new in _RENAMED_PREFIXES:
+        if question.startswith(old):
+            return new + question[len(old) :]
+    return question
+
+
+def _score_value(value: Any) -> float:
+    return math.nan if _is_refusal(value) else float(value)
+
+
+def _sample_rows(sample: EvalSample, base: dict[str, Any]) -> list[dict[str, Any]]:
+    """One row per epoch of `sample` (several for adaptive-epoch samples).
+
+    Rows carry the epoch's final "completion" and the scale "levels" in place
+    of its answer, which `log_rows` extracts for all rows at once.
+    """
+    language, question = parse_sample_id(str(sample.id))
+    question = normalize_question(question)
+    metadata = sample.metadata or {}
+    levels = metadata.get("levels", 7)
+    score = next(iter((sample.scores or {}).values()), None)
+    records = sample.store.get(ATTEMPTS_KEY, [])
+    row = {
+        **base,
+        "language": language or base["language"],
+        "sample_id": str(sample.id),
+        "question": question,
+        "assessment": metadata.get("assessment") or assessment_for(question),
+        "levels": levels,
+    }
+
+    epoch_values = (score.metadata or {}).get("epoch_values") if score else None
+    if epoch_values is None:
+        # One Inspect epoch, one row.
+        usage = sample.model_usage.values()
+        return [
+            {
+                **row,
+                "epoch": sample.epoch,
+                "completion": sample.output.completion,
+                "score": _score_value(score.value) if score else math.nan,
+                "refused": score is None or _is_refusal(score.value),
+                "attempts": len(records)
+                or sum(m.role == "assistant" for m in sample.messages),
+                "input_tokens": sum(u.input_tokens for u in usage),
+                "output_tokens": sum(u.output_tokens for u in usage),
+                "latency": sample.total_time,
+            }
+        ]
+
+    # Adaptive epochs ran inside one sample; split it using the attempt records.
+    rows = []
+    for epoch, value in enumerate(epoch_values, start=1):
+        attempts = [a for a in records if a["epoch"] == epoch]
+        final = attempts[-1]["completion"] if attempts else None
+        rows.append(
+            {
+                **row,
+                "epoch": epoch,
+                "completion": final,
+                "score": _score_value(value),
+                "refused": _is_refusal(value),
+                "attempts": len(attempts),
+                "input_tokens": sum(a["input_tokens"] or 0 for a in attempts),
+                "output_tokens": sum(a["output_tokens"] or 0 for a in attempts),
+                "latency": math.nan,
+            }
+        )
+    return rows
+
+
+def log_rows(log: EvalLog, relative_path: str) -> pd.DataFrame:
+    """Results rows for every sample x epoch of a (successful) log."""
+    task = log.eval.task_registry_name or log.eval.task
+    base = {
+        "log": relative_path,
+        "model": log.eval.model.split("/")[-1],
+        # Early runs suffix the task name with "_task".
+        "task": task.split("/")[-1].removesuffix("_task"),
+        "language": log.eval.task_args.get("language", "en"),
+    }
+    rows = [row for sample in log.samples or [] for row in _sample_rows(sample, base)]
+    answers = extract_answers(
+        [row["completion"] for row in rows], [row["levels"] for row in rows]
+    )
+    frame = pd.DataFrame(rows, columns=[*PARTITIONS, *_COLUMNS])
+    # Null where there is no answer, or one too large to hold.
+    frame["answer"] = pd.arrays.IntegerArray(
+        answers.values, (answers.starts < 0) | (answers.values < 0)
+    )
+    return frame.astype(_COLUMNS)
+
+
+def _part_name(relative_path: str) -> str:
+    """File name of a log's rows within each partition directory."""
+    digest = hashlib.sha1(relative_path.encode()).hexdigest()[:8]
+    return f"{Path(relative_path).stem}-{digest}.parquet"
+
+
+def write_log(frame: pd.DataFrame, store: Path, relative_path: str) -> list[Path]:
+    """Write a log's rows into their partitions; returns the files written."""
+    written = []
+    for (model, task, language), part in frame.groupby(PARTITIONS, sort=False):
+        directory = store / f"model={model}" / f"task={task}" / f"language={language}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / _part_name(relative_path)
+        part.drop(columns=PARTITIONS).to_parquet(path, index=False)
+        written.append(path)
+    return written
+
+
+class IngestStats(NamedTuple):
+    """What an `ingest` run did, in logs."""
+
+    added: int
+    updated: int
+    unchanged: int
+    removed: int
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_catalog(store: Path) -> dict[str, dict[str, Any]]:
+    """The store's catalog: log path (relative to the logs dir) -> entry.
+
+    Each entry records the log's size, mtime and SHA-256 when it was ingested,
+    its header fields (model, task, language, status) and the Parquet files
+    its rows were written to (relative to the store).
+    """
+    try:
+        return json.loads((store / CATALOG_NAME).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_catalog(store: Path, catalog: dict[str, dict[str, Any]]) -> None:
+    tmp = store / f"{CATALOG_NAME}.tmp"
+    tmp.write_text(json.dumps(catalog, indent=1, sort_keys=True))
+    os.replace(tmp, store / CATALOG_NAME)
+
+
+def _remove_files(store: Path, files: Iterable[str]) -> None:
+    for name in files:
+        path = store / name
+        path.unlink(missing_ok=True)
+        # Drop partition directories left empty.
+        for parent in path.parents:
+            if parent == store or any(parent.iterdir()):
+                break
+            parent.rmdir()
+
+
+def ingest(logs_dir: Path, store: Path, full: bool = False) -> IngestStats:
+    """Bring `store` up to date with the `.eval` logs under `logs_dir`.
+
+    Only logs that are new or whose contents changed (e.g. rewritten in place
+    by scripts/rescore.py) are read; a log whose size and mtime match the
+    catalog is skipped without reading it, and one whose contents hash the
+    same is skipped after hashing. Rows of logs that no longer exist are
+    dropped. Logs that did not finish successfully are catalogued but have no
+    rows.
+
+    Args:
+        logs_dir: Directory searched recursively for `.eval` logs.
+        store: Dataset directory.
+        full: Discard the store and re-ingest every log.
+    """
+    if full and store.exists():
+        shutil.rmtree(store)
+    store.mkdir(parents=True, exist_ok=True)
+    catalog = read_catalog(store)
+    added = updated = unchanged = 0
+
+    seen = set()
+    for path in sorted(logs_dir.glob("**/*.eval")):
+        relative_path = path.relative_to(logs_dir).as_posix()
+        seen.add(relative_path)
+        stat = path.stat()
+        entry = catalog.get(relative_path)
+        if entry and (entry["size"], entry["mtime"]) == (stat.st_size, stat.st_mtime):
+            unchanged += 1
+            continue
+        sha256 = file_sha256(path)
+        if entry and entry["sha256"] == sha256:
+            # Touched or copied, but the same contents.
+            entry.update(size=stat.st_size, mtime=stat.st_mtime)
+            unchanged += 1
+            continue
+
+        try:
+            log = read_eval_log(str(path))
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Failed to read {path}: {e}")
+            continue
+        _remove_files(store, entry["files"] if entry else [])
+        files = []
+        if log.status == "success":
+            written = write_log(log_rows(log, relative_path), store, relative_path)
+            files = [p.relative_to(store).as_posix() for p in written]
+        catalog[relative_path] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "sha256": sha256,
+            "model": log.eval.model,
+            "task": log.eval.task_registry_name or log.eval.task,
+            "language": log.eval.task_args.get("language", "en"),
+            "status": log.status,
+            "files": files,
+        }
+        if entry:
+            updated += 1
+        else:
+            added += 1
+
+    removed = [p for p in catalog if p not in seen]
+    for relative_path in removed:
+        _remove_files(store, catalog.pop(relative_path)["files"])
+
+    _write_catalog(store, catalog)
+    return IngestStats(added, updated, unchanged, len(removed))
+
+
+def read_results(
+    store: Path | str,
+    columns: Iterable[str] | None = None,
+    filters: list[tuple[str, str, Any]] | None = None,
+) -> pd.DataFrame:
+    """Read the results dataset (optionally a subset of columns / partitions).
+
+    Args:
+        store: Dataset directory written by `ingest`.
+        columns: Columns to read (default: all).
+        filters: pyarrow filters, e.g. `[("language", "=", "en")]`; filters on
+            the partition columns skip whole directories.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    partitioning = ds.partitioning(
+        pa.schema([(name, pa.string()) for name in PARTITIONS]), flavor="hive"
+    )
+    dataset = ds.dataset(
+        str(store),
+        format="parquet",
+        partitioning=partitioning,
+        ignore_prefixes=[".", "_"],
+    )
+    table = dataset.to_table(
+        columns=list(columns) if columns is not None else None,
+        filter=pq.filters_to_expression(filters) if filters else None,
+    )
+    return table.to_pandas()
+
+
+def question_scores(results: pd.DataFrame) -> pd.DataFrame:
+    """Per-question epoch means, as the `mean_valid` reducer computes them.
+
+    One row per (model, task, language, assessment, question): `score` is the
+    mean over scorable epochs (NaN if every epoch was refused) and
+    `epoch_values` the scores of every epoch.
+    """
+    keys = ["model", "task", "language", "assessment", "question"]
+    return (
+        results.groupby(keys, observed=True, sort=True, dropna=False)["score"]
+        .agg(score="mean", epoch_values=list)
+        .reset_index()
+    )
+
+
+def assessment_scores(results: pd.DataFrame) -> pd.DataFrame:
+    """Per-assessment means over questions, as the `mean` metric computes them.
+
+    One row per (model, task, language, assessment); fully-refused questions
+    are excluded.
+    """
+    keys = ["model", "task", "language", "assessment"]
+    return (
+        question_scores(results)
+        .groupby(keys, observed=True, sort=True, dropna=False)["score"]
+        .mean()
+        .reset_index()
+    )
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    ap = argparse.ArgumentParser(description="Build the columnar results store")
+    ap.add_argument("--logs-dir", type=Path, default=Path("logs"))
+    ap.add_argument("--store", type=Path, default=Path("results"))
+    ap.add_argument(
+        "--full", action="store_true", help="Rebuild the store from scratch"
+    )
+    args = ap.parse_args()
+
+    stats = ingest(args.logs_dir, args.store, full=args.full)
+    print(
+        f"{args.logs_dir} -> {args.store}: {stats.added} added, "
+        f"{stats.updated} updated, {stats.unchanged} unchanged, "
+        f"{stats.removed} removed"
+    )
+
+
+if __name__ == "__main__":
+    main()
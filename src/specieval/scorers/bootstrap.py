@@ -0,0 +1,64 @@
+"""Bootstrap confidence interval of the task mean as a task metric."""
+
+import math
+
+from inspect_ai.scorer import (
+    Metric,
+    SampleScore,
+    ValueToFloat,
+    metric,
+    value_to_float,
+)
+
+from specieval.bootstrap import (
+    DEFAULT_RESAMPLES,
+    DEFAULT_SEED,
+    bootstrap_means,
+    epoch_matrix,
+    percentile_interval,
+)
+from specieval.scorers.refusal import _is_refusal
+
+
+@metric(name="bootstrap_ci")
+def bootstrap_ci(
+    resamples: int = DEFAULT_RESAMPLES,
+    level: float = 0.95,
+    seed: int | None = DEFAULT_SEED,
+    to_float: ValueToFloat = value_to_float(),
+) -> Metric:
+    """Percentile bootstrap interval of the refusal-aware `mean` metric.
+
+    Resamples questions and, within each question, its epochs, using the
+    per-epoch values `mean_valid(epoch_values=True)` and `likert_epochs` record
+    in the score metadata ("epoch_values"); a score without them counts as one
+    epoch.
+    Refusals are excluded as by `mean`. Reported as `bootstrap_ci_lower` and
+    `bootstrap_ci_upper`.
+
+    Args:
+        resamples: Number of bootstrap replicates.
+        level: Confidence level of the interval.
+        seed: RNG seed, so the interval is reproducible.
+        to_float: Converter for the valid values.
+    """
+
+    def metric_fn(scores: list[SampleScore]) -> dict[str, float]:
+        matrix = epoch_matrix(
+            [
+                [
+                    math.nan if _is_refusal(v) else to_float(v)
+                    for v in (s.score.metadata or {}).get(
+                        "epoch_values", [s.score.value]
+                    )
+                ]
+                for s in scores
+            ]
+        )
+        lower, upper = percentile_interval(
+            bootstrap_means(matrix, resamples, seed), level
+        )
+        # Inspect reports each key of a dict-valued metric as its own metric.
+        return {"bootstrap_ci_lower": float(lower), "bootstrap_ci_upper": float(upper)}
+
+    return metric_fn
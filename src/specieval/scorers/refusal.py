@@ -14,9 +14,18 @@ These drop-in replacements *exclude* refusals instead:
 
 The metrics are deliberately named "mean" and "std" so the results dict keys
 that scripts/analysis.py reads are unchanged.
+
+All three share `moments`, which counts valid values and refusals and computes
+the mean and sample variance in one pass over the scores, without building an
+intermediate list. The mean is bit-for-bit `statistics.mean` (it is correctly
+rounded from an exact integer sum) and the variance bit-for-bit
+`np.var(ddof=1)`, at a fraction of the cost on large inputs.
 """
 
+import math
 import statistics
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple, cast
 
 import numpy as np
 from inspect_ai.scorer import (
@@ -25,73 +34,182 @@ from inspect_ai.scorer import (
     SampleScore,
     Score,
     ScoreReducer,
+    Value,
     ValueToFloat,
     metric,
     score_reducer,
     value_to_float,
 )
 
+# Shared default converter; numeric values skip the call when it is in use.
+_TO_FLOAT = value_to_float()
+_NUMBER_TYPES = frozenset({int, float, bool})
+
+# Below this many values the exact mean is summed in Python, above it in numpy.
+_VECTOR_MEAN_MIN = 64
+
 
 def _is_refusal(value: object) -> bool:
     """True if a score value represents a refusal / failed extraction."""
     return value == NOANSWER or isinstance(value, str)
 
 
+class Moments(NamedTuple):
+    """Refusal-aware summary of a sequence of score values."""
+
+    valid: int
+    """Number of valid (non-refused) values."""
+    refusals: int
+    """Number of refusals."""
+    mean: float
+    """Mean of the valid values (NaN if there are none)."""
+    variance: float
+    """Sample variance (ddof=1) of the valid values, if requested (else NaN)."""
+
+
+def moments(
+    values: Iterable[Value],
+    to_float: ValueToFloat = _TO_FLOAT,
+    variance: bool = False,
+) -> Moments:
+    """Count, mean and (optionally) sample variance of the non-refused values.
+
+    Args:
+        values: Score values, consumed in a single pass.
+        to_float: Converter for the valid values.
+        variance: Also compute the sample variance.
+    """
+    refusals = 0
+    fast = to_float is _TO_FLOAT
+
+    def floats() -> Iterator[float]:
+        nonlocal refusals
+        for value in values:
+            if fast and type(value) in _NUMBER_TYPES:
+                yield float(cast(float, value))
+            elif _is_refusal(value):
+                refusals += 1
+            else:
+                yield to_float(value)
+
+    array = np.fromiter(floats(), dtype=np.float64)
+    count = len(array)
+    return Moments(
+        valid=count,
+        refusals=refusals,
+        mean=_exact_mean(array) if count else float("nan"),
+        variance=float(np.var(array, ddof=1)) if variance and count > 1 else math.nan,
+    )
+
+
+def _exact_mean(array: np.ndarray) -> float:
+    """Correctly rounded mean, identical to `statistics.mean`."""
+    if not np.isfinite(array).all():
+        return float(statistics.mean(array.tolist()))
+    n = len(array)
+    # Sum the values exactly as an integer numerator over a power of two; the
+    # final int / int division is correctly rounded.
+    if n < _VECTOR_MEAN_MIN:
+        numerator, shift = 0, 0
+        for x in array.tolist():
+            p, q = x.as_integer_ratio()
+            k = q.bit_length() - 1
+            if k > shift:
+                numerator <<= k - shift
+                shift = k
+            numerator += p << (shift - k)
+        return numerator / (n << shift)
+
+    # Vectorized: split each value into a 53-bit integer mantissa and a binary
+    # exponent, and sum the mantissas exactly per exponent. Summing the high
+    # and low 26-bit halves separately keeps the int64 sums from overflowing.
+    fraction, exponent = np.frexp(array)
+    mantissa = np.ldexp(fraction, 53).astype(np.int64)
+    order = np.argsort(exponent.astype(np.int16), kind="stable")
+    exponent, mantissa = exponent[order], mantissa[order]
+    starts = np.flatnonzero(np.r_[True, exponent[1:] != exponent[:-1]])
+    high = np.add.reduceat(mantissa >> 26, starts)
+    low = np.add.reduceat(mantissa & ((1 << 26) - 1), starts)
+    exponents = exponent[starts].astype(np.int64) - 53
+    lowest = int(exponents[0])
+    numerator = 0
+    for h, lo, e in zip(high.tolist(), low.tolist(), exponents.tolist()):
+        numerator += ((h << 26) + lo) << (e - lowest)
+    if lowest < 0:
+        return numerator / (n << -lowest)
+    return (numerator << lowest) / n
+
+
 @score_reducer(name="mean_valid")
-def mean_valid(to_float: ValueToFloat = value_to_float()) -> ScoreReducer:
+def mean_valid(
+    to_float: ValueToFloat = _TO_FLOAT, epoch_values: bool = False
+) -> ScoreReducer:
     """Mean across epochs, excluding refusals.
 
     Returns NOANSWER if every epoch for the sample was a refusal, so the
     sample metric can in turn exclude it.
+
+    Args:
+        to_float: Converter for the valid values.
+        epoch_values: Also keep the epoch values in the score metadata
+            ("epoch_values"), for tasks that report `bootstrap_ci`; a score
+            that already carries them (from `likert_epochs`) contributes those
+            instead. Off by default, so the reduction allocates nothing per
+            sample.
     """
 
     def reduce(scores: list[Score]) -> Score:
-        valid = [s for s in scores if not _is_refusal(s.value)]
-        if not valid:
+        m = moments((s.value for s in scores), to_float)
+        metadata = (
+            {
+                "epoch_values": [
+                    value
+                    for s in scores
+                    for value in (s.metadata or {}).get("epoch_values", [s.value])
+                ]
+            }
+            if epoch_values
+            else None
+        )
+        if not m.valid:
             return Score(
                 value=NOANSWER,
                 explanation=f"All {len(scores)} epochs refused; excluded.",
+                metadata=metadata,
             )
-        values = [to_float(s.value) for s in valid]
         return Score(
-            value=statistics.mean(values),
+            value=m.mean,
             explanation=(
-                f"Mean over {len(valid)}/{len(scores)} valid epochs "
-                f"({len(scores) - len(valid)} refusals excluded)."
+                f"Mean over {m.valid}/{len(scores)} valid epochs "
+                f"({m.refusals} refusals excluded)."
             ),
+            metadata=metadata,
         )
 
     return reduce
 
 
 @metric(name="mean")
-def mean(to_float: ValueToFloat = value_to_float()) -> Metric:
+def mean(to_float: ValueToFloat = _TO_FLOAT) -> Metric:
     """Mean over samples, excluding refusals (NOANSWER)."""
 
     def metric_fn(scores: list[SampleScore]) -> float:
-        values = [
-            to_float(s.score.value) for s in scores if not _is_refusal(s.score.value)
-        ]
-        if not values:
-            return float("nan")
-        return statistics.mean(values)
+        return moments((s.score.value for s in scores), to_float).mean
 
     return metric_fn
 
 
 @metric(name="std")
-def std(to_float: ValueToFloat = value_to_float()) -> Metric:
+def std(to_float: ValueToFloat = _TO_FLOAT) -> Metric:
     """Sample standard deviation over samples, excluding refusals (NOANSWER)."""
 
     def metric_fn(scores: list[SampleScore]) -> float:
-        values = [
-            to_float(s.score.value) for s in scores if not _is_refusal(s.score.value)
-        ]
+        m = moments((s.score.value for s in scores), to_float, variance=True)
         # Sample std (np.std ddof=1) over the valid values. With < 2 values we
         # return 0.0 (Inspect's std returns nan here); harmless since analysis.py
         # only ever reads the mean metric.
-        if len(values) - 1 < 1:
+        if m.valid < 2:
             return 0.0
-        return float(np.std(values, ddof=1))
+        return math.sqrt(m.variance)
 
     return metric_fn
@@ -1,5 +1,22 @@
 """Solvers for the SpeciEval project."""
 
-from .retry import generate_until_answered
+from .adaptive import adaptive_epochs
+from .cache import ResponseCache
+from .concurrency import AIMDLimiter, adaptive_concurrency
+from .retry import (
+    answer_setup,
+    answer_solver,
+    generate_cached,
+    generate_until_answered,
+)
 
-__all__ = ["generate_until_answered"]
+__all__ = [
+    "AIMDLimiter",
+    "ResponseCache",
+    "adaptive_concurrency",
+    "adaptive_epochs",
+    "answer_setup",
+    "answer_solver",
+    "generate_cached",
+    "generate_until_answered",
+]
@@ -0,0 +1,102 @@
+"""Adaptive (sequential-stopping) epochs for the SpeciEval tasks.
+
+With fixed epochs every question is asked `epochs` times, even though many
+models give the same Likert answer every time. `adaptive_epochs` instead runs
+the epochs of a sample one at a time inside a single Inspect epoch and stops a
+question early once either
+
+- at least `min_epochs` scorable answers are unanimous, or
+- the 95% confidence interval of the running mean (Student's t) is no wider
+  than `ci_width` Likert points,
+
+and never runs more than `max_epochs`. Each epoch starts again from the
+sample's original messages. The per-epoch scores are kept in the sample store
+and reduced by the `likert_epochs` scorer, which records `epochs_used` in the
+score metadata so the log shows how many epochs each question took.
+"""
+
+import math
+import statistics
+from collections.abc import Sequence
+from copy import deepcopy
+
+from inspect_ai.scorer import NOANSWER, Score, Target, Value, value_to_float
+from inspect_ai.solver import Generate, Solver, TaskState, solver
+
+from specieval.scorers.likert import EPOCH_SCORES_KEY, likert
+from specieval.scorers.refusal import _is_refusal
+from specieval.solvers.cache import EPOCH_STORE_KEY
+
+# Two-sided 95% Student's t critical values for 1..30 degrees of freedom.
+_T95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)  # fmt: skip
+
+
+def _t95(df: int) -> float:
+    return _T95[df - 1] if df <= len(_T95) else 1.96
+
+
+def ci_width_95(values: list[float]) -> float:
+    """Full width of the 95% t confidence interval of the mean of `values`."""
+    n = len(values)
+    if n < 2:
+        return math.inf
+    return 2 * _t95(n - 1) * statistics.stdev(values) / math.sqrt(n)
+
+
+def converged(values: Sequence[Value], min_epochs: int, ci_width: float) -> bool:
+    """Whether the epoch score values seen so far are enough to stop.
+
+    Refusals are ignored; at least `min_epochs` scorable answers are required
+    before either stopping rule applies.
+    """
+    to_float = value_to_float()
+    valid = [to_float(v) for v in values if not _is_refusal(v)]
+    if len(valid) < max(min_epochs, 1):
+        return False
+    if len(set(valid)) == 1:
+        return True
+    return ci_width_95(valid) <= ci_width
+
+
+@solver
+def adaptive_epochs(
+    answer: Solver,
+    min_epochs: int = 3,
+    max_epochs: int = 10,
+    ci_width: float = 0.5,
+) -> Solver:
+    """Run `answer` repeatedly per sample until its answers are stable.
+
+    Use with `Epochs(1)` on the task and the `likert_epochs` scorer.
+
+    Args:
+        answer: Answer-generation solver run once per epoch.
+        min_epochs: Scorable answers required before stopping early.
+        max_epochs: Hard cap on epochs per question.
+        ci_width: Stop once the 95% CI of the mean is at most this wide.
+    """
+    if not 1 <= min_epochs <= max_epochs:
+        raise ValueError("Require 1 <= min_epochs <= max_epochs.")
+    score_epoch = likert()
+
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        initial = deepcopy(state.messages)
+        scores: list[Score] = []
+        for epoch in range(1, max_epochs + 1):
+            state.messages = deepcopy(initial)
+            # Distinct response cache entries per internal epoch.
+            state.store.set(EPOCH_STORE_KEY, epoch)
+            state = await answer(state, generate)
+            score = await score_epoch(state, Target(""))
+            scores.append(score if score is not None else Score(value=NOANSWER))
+            if converged([s.value for s in scores], min_epochs, ci_width):
+                break
+        state.store.set(EPOCH_SCORES_KEY, [s.model_dump(mode="json") for s in scores])
+        state.metadata["epochs_used"] = len(scores)
+        return state
+
+    return solve
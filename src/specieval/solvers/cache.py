@@ -0,0 +1,171 @@
+"""Content-addressed local response cache for the SpeciEval solvers.
+
+Re-running a task to debug a scorer, reducer or the analysis pipeline should not
+mean paying the provider again. With a cache directory configured, every
+generation is stored on disk keyed by the model, the full message list, the
+generation config and the epoch, and an identical request is answered from disk
+instead of the model. In replay-only mode a request that is not in the cache is
+an error rather than a live call, so a re-run is guaranteed free and
+deterministic.
+
+Entries are evicted least-recently-used first once the directory grows beyond
+`max_mb`; a cache hit refreshes the entry's mtime.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+
+from inspect_ai.model import ChatMessage, GenerateConfig, ModelOutput, get_model
+from inspect_ai.solver import Generate, TaskState
+
+# Config fields that affect transport, not the response, so don't key on them.
+_TRANSPORT_FIELDS = {
+    "max_retries",
+    "timeout",
+    "attempt_timeout",
+    "max_connections",
+    "cache_prompt",
+    "cache",
+    "batch",
+}
+
+# Sample store key overriding `state.epoch` in the cache key, for solvers that
+# run several epochs within one Inspect epoch (see `adaptive_epochs`).
+EPOCH_STORE_KEY = "specieval:epoch"
+# Sample store key set on concurrently raced candidates (see `_race`), so each
+# candidate gets its own cache entry.
+CANDIDATE_STORE_KEY = "specieval:candidate"
+
+
+class CacheMissError(RuntimeError):
+    """Raised in replay-only mode when a request has no cached response."""
+
+
+class ResponseCache:
+    """Size-bounded, LRU-evicted on-disk store of `ModelOutput`s."""
+
+    def __init__(
+        self, directory: str | Path, max_mb: float = 1024, replay_only: bool = False
+    ):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache entries (created if needed).
+            max_mb: Size bound in megabytes before LRU eviction kicks in.
+            replay_only: Raise `CacheMissError` on a miss instead of generating.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.replay_only = replay_only
+        self._total = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def key(
+        model: str,
+        messages: Sequence[ChatMessage],
+        config: GenerateConfig,
+        epoch: int,
+        candidate: int = 0,
+    ) -> str:
+        """Content hash identifying one generation request."""
+        payload: dict[str, object] = {
+            "model": model,
+            # Message IDs are random per run, so they are not part of the key.
+            "messages": [m.model_dump(mode="json", exclude={"id"}) for m in messages],
+            "config": config.model_dump(
+                mode="json", exclude_none=True, exclude=_TRANSPORT_FIELDS
+            ),
+            "epoch": epoch,
+        }
+        if candidate:
+            payload["candidate"] = candidate
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> ModelOutput | None:
+        """Cached output for `key`, or None on a miss."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # mark as most recently used
+        except FileNotFoundError:
+            return None
+        return ModelOutput.model_validate_json(data)
+
+    def put(self, key: str, output: ModelOutput) -> None:
+        """Store `output` under `key`, evicting old entries if over the bound."""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        data = output.model_dump_json().encode()
+        # Write then rename so concurrent readers never see a partial entry.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self._total += len(data)
+        if self._total > self.max_bytes:
+            self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        self._total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._total -= size
+
+
+@lru_cache(maxsize=None)
+def response_cache(
+    directory: str, max_mb: float = 1024, replay_only: bool = False
+) -> ResponseCache:
+    """Process-wide `ResponseCache` for a directory, shared across tasks."""
+    return ResponseCache(directory, max_mb=max_mb, replay_only=replay_only)
+
+
+async def cached_generate(
+    state: TaskState, generate: Generate, cache: ResponseCache | None
+) -> TaskState:
+    """`generate(state)`, answered from `cache` when it holds the request."""
+    if cache is None:
+        return await generate(state)
+
+    epoch = state.store.get(EPOCH_STORE_KEY, state.epoch)
+    candidate = state.store.get(CANDIDATE_STORE_KEY, 0)
+    key = cache.key(
+        str(state.model), state.messages, get_model().config, epoch, candidate
+    )
+    output = cache.get(key)
+    if output is not None:
+        state.output = output
+        state.messages.append(output.message)
+        return state
+    if cache.replay_only:
+        raise CacheMissError(
+            f"No cached response for sample {state.sample_id} epoch {epoch} "
+            f"in {cache.directory} (replay-only mode)."
+        )
+
+    state = await generate(state)
+    cache.put(key, state.output)
+    return state
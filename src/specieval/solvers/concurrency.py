@@ -0,0 +1,261 @@
+"""Adaptive (AIMD) concurrency control for the SpeciEval solvers.
+
+A fixed `max_connections` is too low for some providers and sets off storms of
+429s on others. With adaptive connections, generations go through a per-provider
+`AIMDLimiter` shared by every task in the process (for OpenRouter models, per
+upstream provider):
+
+- each healthy response raises the limit additively (by `increase` per window
+  of `limit` responses, as in TCP congestion avoidance);
+- a rate-limit or timeout error, a response that was only obtained after
+  Inspect's internal back-off retries, or latency far above the running
+  baseline cuts the limit multiplicatively, at most once per window of
+  requests in flight when the congestion was seen.
+
+The limiter's current limit and throughput are recorded in each sample's
+metadata under "concurrency" and logged at the end of each task.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, NamedTuple
+
+from inspect_ai.hooks import Hooks, TaskEnd, hooks
+from inspect_ai.solver import Generate, Solver, TaskState, solver
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the adaptive limit (also Inspect's own max_connections then).
+MAX_ADAPTIVE_CONNECTIONS = 64
+
+# HTTP statuses providers use for "slow down".
+_OVERLOAD_STATUS = {408, 429, 503, 529}
+
+
+class LimiterStats(NamedTuple):
+    """Snapshot of a limiter's state."""
+
+    limit: float
+    in_flight: int
+    completed: int
+    overloads: int
+    throughput: float  # completed requests per second since the first request
+
+
+class AIMDLimiter:
+    """Additive-increase / multiplicative-decrease cap on in-flight requests."""
+
+    def __init__(
+        self,
+        initial: float = 5,
+        min_limit: float = 1,
+        max_limit: float = MAX_ADAPTIVE_CONNECTIONS,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_factor: float = 3.0,
+        retry_wait: float = 1.0,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial: Starting limit.
+            min_limit: Lowest limit a decrease may reach.
+            max_limit: Highest limit an increase may reach.
+            increase: Limit added per window of healthy responses.
+            decrease: Factor applied to the limit on congestion.
+            latency_factor: Latency above this multiple of the baseline counts
+                as congestion.
+            retry_wait: Seconds of unexplained wait (Inspect's back-off between
+                retries) above which a successful response counts as congestion.
+        """
+        self.limit = min(max(initial, min_limit), max_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.retry_wait = retry_wait
+        self.in_flight = 0
+        self.completed = 0
+        self.overloads = 0
+        self._baseline: float | None = None
+        self._last_cut = float("-inf")
+        self._started: float | None = None
+        self._waiters: list[asyncio.Future[None]] = []
+
+    async def acquire(self) -> float:
+        """Wait for a free slot; returns the request's start time."""
+        while self.in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        now = time.monotonic()
+        if self._started is None:
+            self._started = now
+        return now
+
+    def release(
+        self,
+        start: float,
+        overloaded: bool = False,
+        call_time: float | None = None,
+        cancelled: bool = False,
+    ) -> None:
+        """Free a slot and adjust the limit from the request's outcome.
+
+        Args:
+            start: Value returned by `acquire` for this request.
+            overloaded: The request failed with a rate-limit or timeout error.
+            call_time: Time the provider call itself took, if known; wall time
+                beyond it was spent in retries.
+            cancelled: The request was abandoned; free the slot only.
+        """
+        self.in_flight -= 1
+        if not cancelled:
+            self._adjust(time.monotonic() - start, start, overloaded, call_time)
+        # Wake every waiter; those that still find no free slot wait again.
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    def _adjust(
+        self, elapsed: float, start: float, overloaded: bool, call_time: float | None
+    ) -> None:
+        latency = call_time if call_time is not None else elapsed
+        retried = call_time is not None and elapsed - call_time > self.retry_wait
+        slow = self._baseline is not None and (
+            latency > self.latency_factor * self._baseline
+        )
+        if overloaded or retried or slow:
+            self._on_congestion(start)
+            return
+        self.completed += 1
+        self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+        self._baseline = (
+            latency if self._baseline is None else 0.9 * self._baseline + 0.1 * latency
+        )
+
+    def _on_congestion(self, start: float) -> None:
+        self.overloads += 1
+        # Requests already in flight at the last cut reflect the old limit.
+        if start <= self._last_cut:
+            return
+        self.limit = max(self.min_limit, self.limit * self.decrease)
+        self._last_cut = time.monotonic()
+        logger.info(f"Adaptive concurrency cut to {self.limit:.1f}")
+
+    def stats(self) -> LimiterStats:
+        """Current limit, load and throughput."""
+        elapsed = time.monotonic() - self._started if self._started else 0.0
+        return LimiterStats(
+            limit=self.limit,
+            in_flight=self.in_flight,
+            completed=self.completed,
+            overloads=self.overloads,
+            throughput=self.completed / elapsed if elapsed > 0 else 0.0,
+        )
+
+
+_LIMITERS: dict[str, AIMDLimiter] = {}
+
+
+# Routers whose model names carry the upstream provider as their second part.
+_ROUTERS = frozenset({"openrouter"})
+
+
+def provider_of(model: str) -> str:
+    """Provider whose rate limits apply to `model`.
+
+    The first part of the name ("openai/gpt-4.1" -> "openai"), or for a router
+    the upstream provider behind it ("openrouter/openai/gpt-4.1" ->
+    "openrouter/openai"), so that models routed to different providers do not
+    throttle each other.
+    """
+    parts = model.split("/")
+    if parts[0] in _ROUTERS and len(parts) > 2:
+        return "/".join(parts[:2])
+    return parts[0]
+
+
+def limiter_for(provider: str, initial: float = 5) -> AIMDLimiter:
+    """The process-wide limiter for `provider`, created on first use."""
+    if provider not in _LIMITERS:
+        _LIMITERS[provider] = AIMDLimiter(initial=initial)
+    return _LIMITERS[provider]
+
+
+def is_overload(ex: BaseException) -> bool:
+    """Whether an exception signals rate limiting or an overloaded provider."""
+    if isinstance(ex, TimeoutError):
+        return True
+    status = getattr(ex, "status_code", None) or getattr(ex, "status", None)
+    if status in _OVERLOAD_STATUS:
+        return True
+    text = f"{type(ex).__name__} {ex}".lower()
+    return any(s in text for s in ("ratelimit", "rate limit", "timeout", "overload"))
+
+
+def limited(generate: Generate, limiter: AIMDLimiter) -> Generate:
+    """`generate` gated by, and reporting back to, `limiter`."""
+
+    async def generate_limited(state: TaskState, *args: Any, **kwargs: Any):
+        start = await limiter.acquire()
+        try:
+            state = await generate(state, *args, **kwargs)
+        except asyncio.CancelledError:
+            limiter.release(start, cancelled=True)
+            raise
+        except Exception as ex:
+            limiter.release(start, overloaded=is_overload(ex))
+            raise
+        limiter.release(start, call_time=state.output.time)
+        return state
+
+    return generate_limited
+
+
+@solver
+def adaptive_concurrency(answer: Solver, initial: int = 5) -> Solver:
+    """Run `answer` with its generations gated by the provider's AIMD limiter.
+
+    Set the task's `max_connections` to `MAX_ADAPTIVE_CONNECTIONS` so that the
+    limiter, not Inspect's fixed semaphore, is what bounds concurrency.
+
+    Args:
+        answer: Answer-generation solver.
+        initial: Starting limit for a provider seen for the first time.
+    """
+
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        limiter = limiter_for(provider_of(str(state.model)), initial)
+        state = await answer(state, limited(generate, limiter))
+        state.metadata["concurrency"] = limiter.stats()._asdict()
+        return state
+
+    return solve
+
+
+@hooks(
+    name="specieval_concurrency",
+    description="Logs the concurrency adaptive connections settled on.",
+)
+class ConcurrencyReport(Hooks):
+    """Log each task's provider limit and throughput when the task ends."""
+
+    async def on_task_end(self, data: TaskEnd) -> None:
+        limiter = _LIMITERS.get(provider_of(data.log.eval.model))
+        if limiter is None:
+            return
+        stats = limiter.stats()
+        logger.info(
+            f"{data.log.eval.task}: adaptive concurrency settled at "
+            f"{stats.limit:.1f} in flight, {stats.throughput:.2f} requests/s "
+            f"({stats.overloads} congestion signals)"
+        )
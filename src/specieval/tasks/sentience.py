@@ -2,16 +2,16 @@
 
 from inspect_ai import Epochs, Task, task
 from inspect_ai.dataset import MemoryDataset, Sample
-from inspect_ai.model import GenerateConfig
 from inspect_ai.solver import (
-    generate,
     prompt_template,
     system_message,
 )
 
-from specieval.scorers.likert import likert
+from specieval.assessments import ASSESSMENTS
+from specieval.scorers.bootstrap import bootstrap_ci
+from specieval.scorers.likert import likert, likert_epochs
 from specieval.scorers.refusal import mean, mean_valid, std
-from specieval.solvers.retry import generate_until_answered
+from specieval.solvers.retry import answer_setup
 from specieval.translations import Language, Translations
 
 
@@ -20,14 +20,25 @@ def sentience(
     language: Language = Language.ENGLISH,
     epochs: int = 10,
     max_connections: int = 5,
+    adaptive_connections: bool = False,
+    batch: bool | int = False,
     reverse: bool = False,
     retry_refusals: int = 15,
+    retry_history: int | None = None,
+    retry_candidates: int = 1,
+    cache_prompt: bool = False,
+    response_cache: str | None = None,
+    replay_only: bool = False,
+    adaptive: bool = False,
+    min_epochs: int = 3,
+    ci_width: float = 0.5,
 ):
     """Task to evaluate belief in farm animal sentience."""
 
     if isinstance(language, str):
         language = Language(language)
 
+    assessment = ASSESSMENTS["sentience"]
     translations = Translations(reverse=reverse)
 
     dataset = MemoryDataset(
@@ -37,24 +48,27 @@ def sentience(
                 input=translations.get_string(string_id, language),
                 metadata={"levels": 7, "reverse": reverse},
             )
-            for string_id in [
-                "bfas_1",
-                "bfas_2",
-                "bfas_3",
-                "bfas_4",
-                "bfas_5",
-                "bfas_6",
-            ]
+            for string_id in assessment.questions
         ]
     )
 
-    prefix = translations.get_string("sentience_prefix", language)
+    prefix = translations.get_string(assessment.prefix_id, language)
     likert_scale = translations.get_string("likert_scale", language)
 
-    answer_solver = (
-        generate_until_answered(max_attempts=retry_refusals + 1)
-        if retry_refusals > 0
-        else generate()
+    answer, config = answer_setup(
+        epochs=epochs,
+        max_connections=max_connections,
+        adaptive_connections=adaptive_connections,
+        batch=batch,
+        retry_refusals=retry_refusals,
+        retry_history=retry_history,
+        retry_candidates=retry_candidates,
+        cache_prompt=cache_prompt,
+        response_cache=response_cache,
+        replay_only=replay_only,
+        adaptive=adaptive,
+        min_epochs=min_epochs,
+        ci_width=ci_width,
     )
 
     return Task(
@@ -62,13 +76,11 @@ def sentience(
         solver=[
             system_message(f"\n{prefix}\n\n{likert_scale}\n"),
             prompt_template(translations.get_string("cot_template", language)),
-            answer_solver,
+            answer,
         ],
-        scorer=likert(),
-        metrics=[mean(), std()],
-        epochs=Epochs(epochs, mean_valid()),
-        config=GenerateConfig(
-            max_connections=max_connections,
-        ),
+        scorer=likert_epochs() if adaptive else likert(),
+        metrics=[mean(), std(), bootstrap_ci()],
+        epochs=Epochs(1 if adaptive else epochs, mean_valid(epoch_values=True)),
+        config=config,
         name=f"sentience_{language.value}",
     )
@@ -0,0 +1,218 @@
+"""Precompiled binary bundle of the translations CSVs.
+
+`python -m specieval.translations.bundle` compiles every translations CSV in
+the data directory into one `translations.bundle` file, so short-lived worker
+processes can load translations by memory-mapping a few kilobytes instead of
+re-parsing CSV text. The bundle records the SHA-256 of each source CSV;
+`Translations` only trusts a table whose hash matches the CSV on disk and
+otherwise falls back to parsing the CSV, so a stale bundle is never wrong, just
+slower.
+
+Layout (little-endian, version 1):
+
+- header: magic, version, table count, string count, string blob length
+- string index: (offset, length) into the UTF-8 blob per interned string
+- string blob: every distinct ID, language code and value, stored once
+- per table: CSV SHA-256, CSV file name, string IDs, languages, then the
+  (string_id, language) -> value offset index, all as string-table indices
+
+Usage:
+    python -m specieval.translations.bundle          # rebuild the bundle
+    python -m specieval.translations.bundle --check  # exit 1 if stale
+"""
+
+import argparse
+import hashlib
+import mmap
+import struct
+import sys
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+BUNDLE_NAME = "translations.bundle"
+BUNDLE_MAGIC = b"SPVT"
+BUNDLE_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+_STRING = struct.Struct("<II")
+_TABLE = struct.Struct("<32sIIII")
+_INDEX = struct.Struct("<I")
+_ENTRY = struct.Struct("<III")
+
+# (string_ids in file order, languages in column order, entries)
+Table = tuple[list[str], list[str], Mapping[tuple[str, str], str]]
+
+
+class _Strings:
+    """Interned strings decoded on demand from the memory-mapped blob."""
+
+    def __init__(self, buf: mmap.mmap, index_offset: int, count: int, blob: int):
+        self._buf = buf
+        self._index_offset = index_offset
+        self._count = count
+        self._blob = blob
+        self._decoded: dict[int, str] = {}
+
+    def __getitem__(self, i: int) -> str:
+        value = self._decoded.get(i)
+        if value is None:
+            if not 0 <= i < self._count:
+                raise ValueError(f"String index {i} out of range")
+            offset, length = _STRING.unpack_from(
+                self._buf, self._index_offset + i * _STRING.size
+            )
+            start = self._blob + offset
+            value = self._decoded[i] = self._buf[start : start + length].decode()
+        return value
+
+
+class _Entries(Mapping[tuple[str, str], str]):
+    """(string_id, language) -> value, with values read lazily from the bundle."""
+
+    def __init__(self, offsets: dict[tuple[str, str], int], strings: _Strings):
+        self._offsets = offsets
+        self._strings = strings
+
+    def __getitem__(self, key: tuple[str, str]) -> str:
+        return self._strings[self._offsets[key]]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+def csv_digest(data: bytes) -> bytes:
+    """Content hash recorded for (and checked against) each source CSV."""
+    return hashlib.sha256(data).digest()
+
+
+def read_table(bundle_path: Path, name: str, digest: bytes) -> Table | None:
+    """Load CSV `name` from a bundle, or None if absent, stale or unreadable.
+
+    Args:
+        bundle_path: Path to the compiled bundle.
+        name: File name of the source CSV the table was compiled from.
+        digest: `csv_digest` of that CSV's current contents.
+    """
+    try:
+        with open(bundle_path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        return _read_table(buf, name, digest)
+    except (struct.error, UnicodeDecodeError, ValueError):
+        return None
+
+
+def _read_table(buf: mmap.mmap, name: str, digest: bytes) -> Table | None:
+    magic, version, n_tables, n_strings, blob_len = _HEADER.unpack_from(buf, 0)
+    if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+        return None
+    index_offset = _HEADER.size
+    blob = index_offset + n_strings * _STRING.size
+    strings = _Strings(buf, index_offset, n_strings, blob)
+
+    offset = blob + blob_len
+    for _ in range(n_tables):
+        table_digest, name_idx, n_ids, n_langs, n_entries = _TABLE.unpack_from(
+            buf, offset
+        )
+        offset += _TABLE.size
+        ids_offset = offset
+        langs_offset = ids_offset + n_ids * _INDEX.size
+        entries_offset = langs_offset + n_langs * _INDEX.size
+        offset = entries_offset + n_entries * _ENTRY.size
+        if strings[name_idx] != name or table_digest != digest:
+            continue
+
+        id_idx = [i for (i,) in _unpack(_INDEX, buf, ids_offset, n_ids)]
+        lang_idx = [i for (i,) in _unpack(_INDEX, buf, langs_offset, n_langs)]
+        # Only the (few) key strings are decoded up front; values stay lazy.
+        keys = {i: strings[i] for i in id_idx + lang_idx}
+        offsets = {
+            (keys[sid], keys[lang]): value
+            for sid, lang, value in _unpack(_ENTRY, buf, entries_offset, n_entries)
+        }
+        string_ids = [keys[i] for i in id_idx]
+        languages = [keys[i] for i in lang_idx]
+        return string_ids, languages, _Entries(offsets, strings)
+    return None
+
+
+def _unpack(fmt: struct.Struct, buf: mmap.mmap, offset: int, count: int):
+    return fmt.iter_unpack(buf[offset : offset + count * fmt.size])
+
+
+def build_bundle(csv_paths: list[Path]) -> bytes:
+    """Compile translations CSVs into bundle bytes."""
+    from .translations import parse_csv
+
+    strings: dict[str, int] = {}
+
+    def intern(s: str) -> int:
+        return strings.setdefault(s, len(strings))
+
+    tables = []
+    for path in csv_paths:
+        data = path.read_bytes()
+        string_ids, languages, entries = parse_csv(data.decode("utf-8"))
+        body = [
+            _TABLE.pack(
+                csv_digest(data),
+                intern(path.name),
+                len(string_ids),
+                len(languages),
+                len(entries),
+            )
+        ]
+        body += [_INDEX.pack(intern(s)) for s in string_ids]
+        body += [_INDEX.pack(intern(lang)) for lang in languages]
+        body += [
+            _ENTRY.pack(intern(sid), intern(lang), intern(value))
+            for (sid, lang), value in entries.items()
+        ]
+        tables.append(b"".join(body))
+
+    index, blob = [], bytearray()
+    for s in strings:
+        encoded = s.encode()
+        index.append(_STRING.pack(len(blob), len(encoded)))
+        blob += encoded
+
+    header = _HEADER.pack(
+        BUNDLE_MAGIC, BUNDLE_VERSION, len(tables), len(strings), len(blob)
+    )
+    return b"".join([header, *index, bytes(blob), *tables])
+
+
+def main() -> None:
+    from .translations import _DATA_DIR
+
+    ap = argparse.ArgumentParser(description="Compile translations CSVs")
+    ap.add_argument("--data-dir", type=Path, default=_DATA_DIR)
+    ap.add_argument(
+        "--check", action="store_true", help="Exit 1 if the bundle is out of date"
+    )
+    args = ap.parse_args()
+
+    csv_paths = sorted(args.data_dir.glob("*.csv"))
+    bundle_path = args.data_dir / BUNDLE_NAME
+    data = build_bundle(csv_paths)
+
+    if args.check:
+        current = bundle_path.read_bytes() if bundle_path.exists() else None
+        if current != data:
+            print(f"{bundle_path} is out of date; rebuild it.")
+            sys.exit(1)
+        print(f"{bundle_path} is up to date.")
+        return
+
+    bundle_path.write_bytes(data)
+    print(f"Wrote {bundle_path} ({len(data)} bytes, {len(csv_paths)} tables)")
+
+
+if __name__ == "__main__":
+    main()
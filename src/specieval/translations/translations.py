@@ -1,10 +1,25 @@
-"""Translation support for the SpeciEval project."""
-
+"""Translation support for the SpeciEval project.
+
+Loading is stdlib-only: the task entry point imports this module, so pulling in
+pandas here would tax every `inspect eval` and task listing. pandas is only
+imported if a caller asks for `Translations.df`. When the precompiled
+`translations.bundle` is current (see `bundle.py`) tables are memory-mapped from
+it rather than parsed from the CSV.
+"""
+
+import csv
+import io
+from collections.abc import Mapping
+from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
 
-import pandas as pd
+_DATA_DIR = Path(__file__).parent / "data"
 
 
 class Language(str, Enum):
@@ -30,6 +45,88 @@ class Language(str, Enum):
         return self.value
 
 
+@dataclass(frozen=True)
+class Catalog:
+    """Immutable, indexed view of one translations file.
+
+    Built once per file per process (see `load_catalog`) and shared by every
+    `Translations` instance that reads the same file, so task factories neither
+    re-parse the CSV nor scan it on each lookup.
+    """
+
+    path: Path
+    entries: Mapping[tuple[str, str], str]
+    string_ids: frozenset[str]
+    languages: frozenset[str]
+    source: str
+    """"bundle" if loaded from the precompiled bundle, else "csv"."""
+
+
+def default_path(reverse: bool = False) -> Path:
+    """Path to the bundled forward (or reverse) translations CSV."""
+    name = "translations-reverse.csv" if reverse else "translations.csv"
+    return _DATA_DIR / name
+
+
+def parse_csv(text: str) -> tuple[list[str], list[str], dict[tuple[str, str], str]]:
+    """Parse translations CSV text, skipping blank and "#" comment lines.
+
+    Returns:
+        The string IDs in file order, the language columns, and the
+        (string_id, language) -> value entries.
+    """
+    reader = csv.reader(io.StringIO(text, newline=""))
+    header, *rows = [row for row in reader if row and not row[0].startswith("#")]
+    languages = header[1:]
+    entries: dict[tuple[str, str], str] = {}
+    string_ids: list[str] = []
+    seen: set[str] = set()
+    for string_id, *values in rows:
+        # Duplicate IDs resolve to the first row, as the DataFrame scan did.
+        if string_id in seen:
+            continue
+        seen.add(string_id)
+        string_ids.append(string_id)
+        for lang_code, value in zip(languages, values):
+            # Empty cells are missing translations (NaN under pandas).
+            if value:
+                entries[(string_id, lang_code)] = value
+    return string_ids, languages, entries
+
+
+@lru_cache(maxsize=None)
+def _load_catalog(path: Path) -> Catalog:
+    # Imported here so `python -m specieval.translations.bundle` runs cleanly.
+    from .bundle import BUNDLE_NAME, csv_digest, read_table
+
+    data = path.read_bytes()
+    source = "bundle"
+    table = read_table(path.parent / BUNDLE_NAME, path.name, csv_digest(data))
+    if table is None:
+        source = "csv"
+        table = parse_csv(data.decode("utf-8"))
+    string_ids, languages, entries = table
+    return Catalog(
+        path=path,
+        entries=entries,
+        string_ids=frozenset(string_ids),
+        languages=frozenset(languages),
+        source=source,
+    )
+
+
+def load_catalog(path: Path = None, reverse: bool = False) -> Catalog:
+    """Return the process-wide catalog for a translations file.
+
+    Args:
+        path: Path to the translations CSV file. If None, uses default path.
+        reverse: Whether to use reverse translations (ignored if path is given).
+    """
+    if path is None:
+        path = default_path(reverse)
+    return _load_catalog(Path(path).resolve())
+
+
 class Translations:
     """Manages translations for the SpeciEval project."""
 
@@ -40,13 +137,14 @@ class Translations:
             path: Path to the translations CSV file. If None, uses default path.
             reverse: Whether to use reverse translations.
         """
-        if path is None:
-            if reverse:
-                path = Path(__file__).parent / "data" / "translations-reverse.csv"
-            else:
-                path = Path(__file__).parent / "data" / "translations.csv"
+        self.catalog = load_catalog(path, reverse)
 
-        self.df = pd.read_csv(path, comment="#")
+    @cached_property
+    def df(self) -> "pd.DataFrame":
+        """The translations table as a DataFrame (imports pandas on first use)."""
+        import pandas as pd
+
+        return pd.read_csv(self.catalog.path, comment="#")
 
     def get_string(
         self, string_id: str, language: Language = Language.ENGLISH, **format_args: Any
@@ -67,20 +165,15 @@ class Translations:
         """
         lang_code = str(language)
 
-        # Find the row with the matching ID
-        row = self.df[self.df["string_id"] == string_id]
-
-        if row.empty:
-            raise KeyError(f"String ID not found: {string_id}")
-
-        if lang_code not in self.df.columns:
-            raise ValueError(
-                f"Language {lang_code} is not available in translations file"
-            )
-
-        value = row[lang_code].iloc[0]
+        value = self.catalog.entries.get((string_id, lang_code))
 
-        if pd.isna(value):
+        if value is None:
+            if string_id not in self.catalog.string_ids:
+                raise KeyError(f"String ID not found: {string_id}")
+            if lang_code not in self.catalog.languages:
+                raise ValueError(
+                    f"Language {lang_code} is not available in translations file"
+                )
             raise ValueError(f"No translation for {string_id} in {lang_code}")
 
         # Apply formatting if needed
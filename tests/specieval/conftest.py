@@ -0,0 +1,65 @@
+"""Shared fixtures for the SpeciEval tests."""
+
+import pytest
+from inspect_ai.model import (
+    Model,
+    ModelName,
+    ModelOutput,
+    get_model,
+)
+from inspect_ai.solver import TaskState
+
+
+@pytest.fixture
+def mockllm_model():
+    """Factory for a mockllm model that replies with the given contents in turn."""
+
+    def make(contents: list[str]) -> Model:
+        return get_model(
+            "mockllm/model",
+            custom_outputs=[
+                ModelOutput.from_content(model="mockllm/model", content=c)
+                for c in contents
+            ],
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_generate():
+    """Factory for a fake generate() that returns scripted completions in order.
+
+    Like the real one, the fake appends `output.message` to the conversation.
+    Returns the fake and a dict counting its calls ("n").
+    """
+
+    def make(scripted: list[str]):
+        calls = {"n": 0}
+
+        async def fake_generate(state, **kwargs):
+            out = scripted[min(calls["n"], len(scripted) - 1)]
+            calls["n"] += 1
+            state.output = ModelOutput.from_content("mockllm/model", out)
+            state.messages.append(state.output.message)
+            return state
+
+        return fake_generate, calls
+
+    return make
+
+
+@pytest.fixture
+def make_state():
+    """Factory for a bare TaskState for solver tests."""
+
+    def make() -> TaskState:
+        return TaskState(
+            model=ModelName("mockllm/model"),
+            sample_id="x",
+            epoch=1,
+            input="rate this",
+            messages=[],
+        )
+
+    return make
@@ -0,0 +1,79 @@
+"""Tests for adaptive epochs."""
+
+import pytest
+from inspect_ai import eval
+from inspect_ai.scorer import NOANSWER
+from specieval.scorers.likert import likert_epochs
+from specieval.solvers.adaptive import adaptive_epochs, ci_width_95, converged
+from specieval.solvers.retry import generate_until_answered
+from specieval.tasks import speciesism
+
+
+def test_ci_width_95():
+    assert ci_width_95([4.0]) == float("inf")
+    assert ci_width_95([4.0, 4.0, 4.0]) == 0.0
+    # t(2) = 4.303, stdev 1, n 3
+    assert ci_width_95([3.0, 4.0, 5.0]) == pytest.approx(2 * 4.303 / 3**0.5)
+
+
+def test_converged():
+    assert not converged([4, 4], min_epochs=3, ci_width=0.5)
+    assert converged([4, 4, 4], min_epochs=3, ci_width=0.5)
+    # Refusals do not count towards min_epochs.
+    assert not converged([4, NOANSWER, 4], min_epochs=3, ci_width=0.5)
+    assert not converged([3, 4, 5], min_epochs=3, ci_width=0.5)
+    assert converged([3, 4, 5], min_epochs=3, ci_width=5.0)
+
+
+@pytest.fixture
+def adaptive_state(make_state):
+    state = make_state()
+    state.metadata = {"levels": 7, "reverse": False}
+    return state
+
+
+@pytest.mark.asyncio
+async def test_stable_answers_stop_at_min_epochs(make_generate, adaptive_state):
+    generate, calls = make_generate(["ANSWER: 4"])
+    solver = adaptive_epochs(generate_until_answered(), min_epochs=3, max_epochs=10)
+    state = await solver(adaptive_state, generate)
+    score = await likert_epochs()(state, None)
+
+    assert calls["n"] == 3
+    assert score.value == 4
+    assert score.metadata["epochs_used"] == 3
+    # Each epoch starts from the original messages.
+    assert len(state.messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_noisy_answers_run_to_cap(make_generate, adaptive_state):
+    answers = ["ANSWER: 1", "ANSWER: 7"] * 3
+    generate, calls = make_generate(answers)
+    solver = adaptive_epochs(generate_until_answered(max_attempts=1), max_epochs=6)
+    state = await solver(adaptive_state, generate)
+    score = await likert_epochs()(state, None)
+
+    assert calls["n"] == 6
+    assert score.value == 4
+    assert score.metadata["epoch_values"] == [1, 7, 1, 7, 1, 7]
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        adaptive_epochs(generate_until_answered(), min_epochs=5, max_epochs=3)
+
+
+def test_end_to_end_adaptive(mockllm_model):
+    """Unanimous answers need only min_epochs generations per question."""
+    model = mockllm_model(["ANSWER: 2"] * 12)
+
+    [log] = eval(
+        tasks=speciesism(epochs=10, adaptive=True, min_epochs=3),
+        model=model,
+    )
+
+    assert log.status == "success"
+    assert log.results.scores[0].metrics["mean"].value == 2
+    for sample in log.samples:
+        assert sample.scores["likert_epochs"].metadata["epochs_used"] == 3
@@ -0,0 +1,188 @@
+"""Tests for batch-API execution against a local stand-in batch server."""
+
+import json
+import threading
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from inspect_ai import eval
+from inspect_ai.model import BatchConfig, get_model
+from specieval.tasks import speciesism
+
+
+class StandInBatchServer(ThreadingHTTPServer):
+    """Minimal OpenAI files + batches API that completes batches instantly.
+
+    Replies with a refusal to a fresh prompt and "ANSWER: 5" once the
+    conversation holds an earlier (refused) reply, so every sample needs a
+    follow-up batch round.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.files: dict[str, bytes] = {}
+        self.batches: dict[str, dict] = {}
+        self.batch_sizes: list[int] = []
+        self.sync_requests = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+    def run_batch(self, input_file_id: str, endpoint: str) -> dict:
+        outputs: list[dict] = []
+        for line in self.files[input_file_id].decode().splitlines():
+            request = json.loads(line)
+            outputs.append(
+                {
+                    "id": f"resp-{len(outputs)}",
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "request_id": f"req-{len(outputs)}",
+                        "body": _completion(request["body"]),
+                    },
+                    "error": None,
+                }
+            )
+        batch_id = f"batch-{len(self.batches)}"
+        output_file_id = f"file-{batch_id}-output"
+        self.files[output_file_id] = "\n".join(map(json.dumps, outputs)).encode()
+        self.batch_sizes.append(len(outputs))
+        batch = self.batches[batch_id] = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": endpoint,
+            "input_file_id": input_file_id,
+            "completion_window": "24h",
+            "status": "completed",
+            "output_file_id": output_file_id,
+            "created_at": 0,
+            "request_counts": {
+                "total": len(outputs),
+                "completed": len(outputs),
+                "failed": 0,
+            },
+        }
+        return batch
+
+
+def _completion(body: dict) -> dict:
+    nudged = any(m["role"] == "assistant" for m in body["messages"])
+    return {
+        "id": "chatcmpl-standin",
+        "object": "chat.completion",
+        "created": 0,
+        "model": body["model"],
+        "choices": [
+            {
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": "ANSWER: 5" if nudged else "I won't answer.",
+                },
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 3, "total_tokens": 13},
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StandInBatchServer
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, payload: dict | bytes) -> None:
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers["Content-Length"]))
+
+    def do_POST(self):
+        if self.path == "/v1/files":
+            content_type = self.headers["Content-Type"].encode()
+            form = BytesParser().parsebytes(
+                b"Content-Type: " + content_type + b"\r\n\r\n" + self._body()
+            )
+            [upload] = [p for p in form.get_payload() if p.get_filename()]
+            file_id = f"file-{len(self.server.files)}"
+            self.server.files[file_id] = upload.get_payload(decode=True)
+            self._reply(
+                {
+                    "id": file_id,
+                    "object": "file",
+                    "bytes": len(self.server.files[file_id]),
+                    "created_at": 0,
+                    "filename": upload.get_filename(),
+                    "purpose": "batch",
+                    "status": "processed",
+                }
+            )
+        elif self.path == "/v1/batches":
+            request = json.loads(self._body())
+            self._reply(
+                self.server.run_batch(request["input_file_id"], request["endpoint"])
+            )
+        elif self.path == "/v1/chat/completions":
+            self.server.sync_requests += 1
+            self._reply(_completion(json.loads(self._body())))
+        else:
+            self.send_error(404)
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if parts[1] == "batches":
+            self._reply(self.server.batches[parts[2]])
+        elif parts[1] == "files" and parts[-1] == "content":
+            self._reply(self.server.files[parts[2]])
+        else:
+            self.send_error(404)
+
+
+@pytest.fixture
+def batch_server():
+    server = StandInBatchServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+
+
+def test_batch_task_config():
+    task = speciesism(batch=500)
+
+    assert task.config.batch == 500
+    # Inspect picks the batch-mode concurrency rather than the sync default.
+    assert task.config.max_connections is None
+    assert speciesism().config.batch is None
+
+
+def test_batch_run_with_retry_rounds(batch_server, monkeypatch):
+    """Every request goes through batches; refusals are retried in a new batch."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    model = get_model(
+        "openai/gpt-4o-mini", base_url=batch_server.base_url, responses_api=False
+    )
+
+    [log] = eval(
+        tasks=speciesism(epochs=2, batch=True),
+        model=model,
+        batch=BatchConfig(size=8, send_delay=0.1, tick=0.1),
+        max_retries=1,
+        display="none",
+    )
+
+    assert log.status == "success"
+    assert batch_server.sync_requests == 0
+    # 4 questions x 2 epochs: one round of refusals, then one of answers.
+    assert sum(batch_server.batch_sizes) == 16
+    assert len(batch_server.batch_sizes) >= 2
+    assert log.results.scores[0].metrics["mean"].value == 5
@@ -0,0 +1,110 @@
+"""Tests for the bootstrap confidence intervals and rank intervals."""
+
+import math
+
+import numpy as np
+from inspect_ai.scorer import NOANSWER, SampleScore, Score
+from specieval.bootstrap import (
+    bootstrap_means,
+    composite_bootstrap,
+    epoch_matrix,
+    rank_intervals,
+)
+from specieval.composite import COMPOSITE_QUESTIONS, composite_score
+from specieval.scorers.bootstrap import bootstrap_ci
+from specieval.scorers.refusal import mean_valid
+
+
+def _reduced(epochs):
+    reduce = mean_valid(epoch_values=True)
+    return [SampleScore(score=reduce([Score(value=v) for v in e])) for e in epochs]
+
+
+def test_epoch_matrix_drops_refusals_and_pads():
+    matrix = epoch_matrix([[1.0, math.nan, 3.0], [math.nan], [5.0]])
+
+    np.testing.assert_array_equal(matrix, [[1.0, 3.0], [np.nan, np.nan], [5.0, np.nan]])
+
+
+def test_bootstrap_means_seeded_and_bounded():
+    rng = np.random.default_rng(1)
+    matrix = epoch_matrix(rng.integers(1, 8, (20, 10)).astype(float))
+
+    first = bootstrap_means(matrix, resamples=500, seed=3)
+    assert first.shape == (500,)
+    np.testing.assert_array_equal(first, bootstrap_means(matrix, 500, seed=3))
+    assert not np.array_equal(first, bootstrap_means(matrix, 500, seed=4))
+    assert np.nanmin(matrix) <= first.min() and first.max() <= np.nanmax(matrix)
+
+
+def test_bootstrap_means_constant_answers_have_no_spread():
+    """Fully-refused questions are excluded rather than counted as 0."""
+    matrix = epoch_matrix([[6.0, math.nan, 6.0], [math.nan, math.nan], [6.0]])
+
+    assert set(bootstrap_means(matrix, resamples=200).tolist()) == {6.0}
+
+
+def test_mean_valid_records_epoch_values():
+    [score] = _reduced([[6, NOANSWER, 5]])
+    assert score.score.metadata == {"epoch_values": [6, NOANSWER, 5]}
+
+    # An already-reduced score (adaptive epochs) passes its epochs through.
+    adaptive = Score(value=5.5, metadata={"epoch_values": [5, 6]})
+    reduce = mean_valid(epoch_values=True)
+    assert reduce([adaptive]).metadata == {"epoch_values": [5, 6]}
+
+    # Off by default: the plain reduction records nothing.
+    assert mean_valid()([Score(value=6), Score(value=5)]).metadata is None
+
+
+def test_bootstrap_ci_metric_brackets_mean():
+    rng = np.random.default_rng(0)
+    epochs = [list(rng.integers(1, 8, 10)) + [NOANSWER] for _ in range(30)]
+    scores = _reduced(epochs)
+    point = np.mean([s.score.value for s in scores])
+
+    ci = bootstrap_ci()(scores)
+    assert ci["bootstrap_ci_lower"] < point < ci["bootstrap_ci_upper"]
+    assert ci == bootstrap_ci()(scores)
+    # Scores without recorded epochs count as one epoch each.
+    plain = [SampleScore(score=Score(value=v)) for v in [4, 4, NOANSWER]]
+    assert bootstrap_ci()(plain) == {
+        "bootstrap_ci_lower": 4.0,
+        "bootstrap_ci_upper": 4.0,
+    }
+
+
+def test_composite_bootstrap_matches_composite_score():
+    """With one answer per question every replicate is the composite itself."""
+    rng = np.random.default_rng(2)
+    answers = rng.integers(1, 8, (5, len(COMPOSITE_QUESTIONS))).astype(float)
+    replicates = composite_bootstrap(answers[..., None], resamples=10)
+
+    assert replicates.shape == (10, 5)
+    for model, row in enumerate(answers):
+        expected = composite_score(dict(zip(COMPOSITE_QUESTIONS, row)))
+        assert np.allclose(replicates[:, model], expected)
+
+
+def test_composite_bootstrap_missing_question_is_nan():
+    values = np.full((1, len(COMPOSITE_QUESTIONS), 2), 4.0)
+    values[0, 0] = np.nan
+
+    assert np.isnan(composite_bootstrap(values, resamples=5)).all()
+
+
+def test_rank_intervals():
+    """Separated models get point ranks; overlapping ones share an interval."""
+    rng = np.random.default_rng(0)
+    replicates = np.column_stack(
+        [
+            rng.normal(90, 0.1, 1000),
+            rng.normal(50, 1.0, 1000),
+            rng.normal(50, 1.0, 1000),
+            np.full(1000, np.nan),
+        ]
+    )
+
+    lower, upper = rank_intervals(replicates)
+    np.testing.assert_array_equal(lower, [1, 2, 2, 4])
+    np.testing.assert_array_equal(upper, [1, 3, 3, 4])
@@ -0,0 +1,88 @@
+"""Tests for the local response cache."""
+
+import os
+
+import pytest
+from inspect_ai.model import ChatMessageUser, GenerateConfig, ModelOutput
+from specieval.solvers.cache import CacheMissError, ResponseCache
+from specieval.solvers.retry import generate_until_answered
+
+
+@pytest.fixture(autouse=True)
+def _eval_model(monkeypatch):
+    # cached_generate keys on the active model's config.
+    monkeypatch.setenv("INSPECT_EVAL_MODEL", "mockllm/model")
+
+
+def test_key_ignores_message_ids_and_transport_config():
+    a = [ChatMessageUser(content="rate this")]
+    b = [ChatMessageUser(content="rate this")]
+    key = ResponseCache.key("m", a, GenerateConfig(temperature=0.5), 1)
+
+    assert a[0].id != b[0].id
+    assert key == ResponseCache.key(
+        "m", b, GenerateConfig(temperature=0.5, max_connections=20), 1
+    )
+    assert key != ResponseCache.key("m", b, GenerateConfig(temperature=0.5), 2)
+    assert key != ResponseCache.key("m", b, GenerateConfig(temperature=0.7), 1)
+
+
+def test_put_get_roundtrip(tmp_path):
+    cache = ResponseCache(tmp_path)
+    output = ModelOutput.from_content("mockllm/model", "ANSWER: 3")
+
+    assert cache.get("ab" * 32) is None
+    cache.put("ab" * 32, output)
+    assert cache.get("ab" * 32).completion == "ANSWER: 3"
+
+
+def test_lru_eviction(tmp_path):
+    """Over the size bound, least recently used entries go first."""
+    output = ModelOutput.from_content("mockllm/model", "x" * 2000)
+    size = len(output.model_dump_json())
+    cache = ResponseCache(tmp_path, max_mb=2.5 * size / (1024 * 1024))
+
+    cache.put("aa" * 32, output)
+    cache.put("bb" * 32, output)
+    os.utime(cache._path("aa" * 32), (0, 0))
+    os.utime(cache._path("bb" * 32), (1, 1))
+    cache.get("aa" * 32)  # refresh: "bb" is now least recently used
+    cache.put("cc" * 32, output)
+
+    assert cache.get("aa" * 32) is not None
+    assert cache.get("bb" * 32) is None
+    assert cache.get("cc" * 32) is not None
+
+
+@pytest.mark.asyncio
+async def test_retries_replay_from_cache(tmp_path, make_generate, make_state):
+    """A second run is answered entirely from the cache."""
+    solver = generate_until_answered(max_attempts=3, cache_dir=str(tmp_path / "c"))
+    generate, calls = make_generate(["I won't answer.", "ANSWER: 5"])
+    first = await solver(make_state(), generate)
+
+    replay = generate_until_answered(
+        max_attempts=3, cache_dir=str(tmp_path / "c"), replay_only=True
+    )
+    generate, replay_calls = make_generate(["ANSWER: 1"])
+    second = await replay(make_state(), generate)
+
+    assert calls["n"] == 2
+    assert replay_calls["n"] == 0
+    assert second.output.completion == first.output.completion == "ANSWER: 5"
+    assert [m.text for m in second.messages] == [m.text for m in first.messages]
+
+
+@pytest.mark.asyncio
+async def test_replay_only_miss_raises(tmp_path, make_generate, make_state):
+    solver = generate_until_answered(cache_dir=str(tmp_path), replay_only=True)
+    generate, calls = make_generate(["ANSWER: 5"])
+
+    with pytest.raises(CacheMissError):
+        await solver(make_state(), generate)
+    assert calls["n"] == 0
+
+
+def test_replay_only_requires_cache_dir():
+    with pytest.raises(ValueError):
+        generate_until_answered(replay_only=True)
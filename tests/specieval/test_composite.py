@@ -0,0 +1,96 @@
+"""Tests for the composite SpeciEval score."""
+
+import math
+
+import numpy as np
+import pandas as pd
+from inspect_ai.scorer import NOANSWER, SampleScore, Score
+from specieval.composite import COMPOSITE_QUESTIONS, composite_score, composite_scores
+from specieval.scorers.composite import composite
+
+
+def _sample_scores(values):
+    return [SampleScore(score=Score(value=v), sample_id=q) for q, v in values.items()]
+
+
+def test_composite_bounds():
+    """Most animal-friendly answers score 100, least friendly score 0."""
+    best = {q: 7 if q.startswith("bfas_") else 1 for q in COMPOSITE_QUESTIONS}
+    worst = {q: 8 - v for q, v in best.items()}
+
+    assert composite_score(best) == 100.0
+    assert composite_score(worst) == 0.0
+    assert composite_score({q: 4 for q in COMPOSITE_QUESTIONS}) == 50.0
+
+
+def test_composite_requires_every_question():
+    values = {q: 4 for q in COMPOSITE_QUESTIONS[1:]}
+
+    assert math.isnan(composite_score(values))
+    assert math.isnan(composite_score({**values, "spec_1": math.nan}))
+
+
+def test_composite_metric_ignores_other_questions():
+    """Non-composite questions (e.g. la4N_1) don't move the metric."""
+    values = {q: 4 for q in COMPOSITE_QUESTIONS}
+    metric_fn = composite()
+
+    assert metric_fn(_sample_scores(values)) == 50.0
+    assert metric_fn(_sample_scores({**values, "la4N_1": 7})) == 50.0
+
+
+def test_composite_metric_refused_question_is_nan():
+    values = {q: 4 for q in COMPOSITE_QUESTIONS}
+
+    assert math.isnan(composite()(_sample_scores({**values, "bfas_3": NOANSWER})))
+
+
+def test_composite_metric_accepts_language_qualified_ids():
+    values = {f"de:{q}": 4 for q in COMPOSITE_QUESTIONS}
+
+    assert composite()(_sample_scores(values)) == 50.0
+
+
+def _synthetic_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Respondent-like answers (some epoch means), ~1% missing, extra columns."""
+    rng = np.random.default_rng(seed)
+    columns = [*COMPOSITE_QUESTIONS, "la4N_1", "Country"]
+    values = (
+        rng.integers(1, 8, (rows, len(columns))) / rng.choice([1, 3, 10], rows)[:, None]
+    )
+    frame = pd.DataFrame(values, columns=columns, index=[f"r{i}" for i in range(rows)])
+    frame = frame.mask(rng.random(frame.shape) < 0.01)
+    return frame
+
+
+def _scalar_scores(frame: pd.DataFrame) -> list[float]:
+    """`composite_score` row by row, the reference `composite_scores` must match."""
+    return [
+        composite_score(row)
+        for row in frame[list(COMPOSITE_QUESTIONS)].to_dict("records")
+    ]
+
+
+def test_composite_scores_matches_scalar_exactly():
+    frame = _synthetic_frame(500)
+    scores = composite_scores(frame, list(COMPOSITE_QUESTIONS))
+
+    np.testing.assert_array_equal(scores.to_numpy(), _scalar_scores(frame))
+    assert scores.index.equals(frame.index)
+    assert composite_scores(frame).isna().any()
+
+
+def test_composite_scores_missing_column_is_nan():
+    frame = pd.DataFrame({q: [4.0] for q in COMPOSITE_QUESTIONS[1:]})
+
+    assert composite_scores(frame).isna().all()
+    assert composite_scores(frame.assign(spec_1=4.0)).tolist() == [50.0]
+
+
+def test_composite_scores_100k_rows():
+    """Whole-frame scoring matches the scalar composite on a large frame."""
+    frame = _synthetic_frame(100_000)
+
+    np.testing.assert_array_equal(
+        composite_scores(frame).to_numpy(), _scalar_scores(frame)
+    )
@@ -0,0 +1,151 @@
+"""Tests for the adaptive (AIMD) concurrency limiter."""
+
+import asyncio
+
+import pytest
+from inspect_ai import eval
+from inspect_ai.model import ModelOutput
+from specieval.solvers.concurrency import (
+    AIMDLimiter,
+    is_overload,
+    limited,
+    limiter_for,
+    provider_of,
+)
+from specieval.tasks import speciesism
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class MockEndpoint:
+    """Stand-in provider that rejects requests beyond `capacity` in flight."""
+
+    def __init__(self, capacity: int, latency: float = 0.005):
+        self.capacity = capacity
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+        self.rejected = 0
+
+    async def generate(self, state, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.in_flight > self.capacity:
+                self.rejected += 1
+                raise RateLimitError("rate limit exceeded")
+            await asyncio.sleep(self.latency)
+            state.output = ModelOutput.from_content("mockllm/model", "ANSWER: 4")
+            return state
+        finally:
+            self.in_flight -= 1
+
+
+async def _drive(limiter, endpoint, requests, make_state):
+    generate = limited(endpoint.generate, limiter)
+
+    async def request():
+        while True:
+            try:
+                return await generate(make_state())
+            except RateLimitError:
+                await asyncio.sleep(0)
+
+    await asyncio.gather(*(request() for _ in range(requests)))
+
+
+@pytest.mark.asyncio
+async def test_additive_increase():
+    limiter = AIMDLimiter(initial=2)
+    for _ in range(4):
+        start = await limiter.acquire()
+        limiter.release(start)
+
+    # +1/limit per healthy response: 2 -> 2.5 -> 2.9 -> 3.24 -> 3.55
+    assert limiter.limit == pytest.approx(3.55, abs=0.01)
+    assert limiter.stats().completed == 4
+
+
+@pytest.mark.asyncio
+async def test_multiplicative_decrease_once_per_window():
+    limiter = AIMDLimiter(initial=16)
+    starts = [await limiter.acquire() for _ in range(4)]
+    for start in starts:
+        limiter.release(start, overloaded=True)
+
+    # Requests already in flight at the cut do not cut again.
+    assert limiter.limit == 8
+    assert limiter.stats().overloads == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_backoff_retries_count_as_congestion():
+    limiter = AIMDLimiter(initial=8, retry_wait=0.01)
+    start = await limiter.acquire()
+    await asyncio.sleep(0.05)
+    limiter.release(start, call_time=0.001)
+
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_settles_near_endpoint_capacity(make_state):
+    """Against a rate-limiting endpoint the limit converges below its capacity."""
+    endpoint = MockEndpoint(capacity=8)
+    limiter = AIMDLimiter(initial=2, max_limit=64)
+    await _drive(limiter, endpoint, requests=400, make_state=make_state)
+
+    assert limiter.in_flight == 0
+    assert 2 <= limiter.limit <= 12
+    assert limiter.stats().completed >= 400
+    # Far fewer rejections than requests: the limiter backs off.
+    assert endpoint.rejected < 100
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_free_their_slot(make_state):
+    limiter = AIMDLimiter(initial=1)
+
+    async def hang(state, **kwargs):
+        await asyncio.sleep(10)
+
+    task = asyncio.create_task(limited(hang, limiter)(make_state()))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.in_flight == 0
+    assert limiter.limit == 1
+
+
+def test_is_overload():
+    assert is_overload(RateLimitError("slow down"))
+    assert is_overload(TimeoutError())
+    assert not is_overload(ValueError("bad request"))
+
+
+def test_routed_providers_get_separate_limiters():
+    assert provider_of("openrouter/openai/gpt-4.1") == "openrouter/openai"
+    assert provider_of("openai/gpt-4.1") == "openai"
+    assert provider_of("mockllm/model") == "mockllm"
+
+    openai = limiter_for(provider_of("openrouter/openai/gpt-4.1"))
+    assert limiter_for(provider_of("openrouter/openai/gpt-5.1-chat")) is openai
+    assert limiter_for(provider_of("openrouter/x-ai/grok-4")) is not openai
+
+
+def test_end_to_end_adaptive_connections(mockllm_model):
+    model = mockllm_model(["ANSWER: 3"] * 8)
+
+    [log] = eval(
+        tasks=speciesism(epochs=2, adaptive_connections=True, max_connections=2),
+        model=model,
+    )
+
+    assert log.status == "success"
+    for sample in log.samples:
+        assert sample.metadata["concurrency"]["limit"] >= 2
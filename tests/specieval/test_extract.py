@@ -0,0 +1,86 @@
+"""Tests for answer extraction."""
+
+import pytest
+from specieval.extract import (
+    NO_ANSWER,
+    OUT_OF_RANGE,
+    extract_answer,
+    extract_answers,
+    is_scorable,
+)
+from specieval.scorers.likert import likert
+
+from .test_likert import MockTaskState
+
+COMPLETIONS = [
+    "Reasoning...\nANSWER: 5",
+    "ANSWER :  3 and later ANSWER: 6",
+    "I won't answer.",
+    "ANSWER: 9",
+    None,
+    "ANSWER: 0",
+    "",
+    "ANSWER:7",
+    "ANSWER: 12",
+    "ANSWER: 99999999999999999999",
+    "ANSWER: 00000000000000000000004",
+]
+
+
+def test_extract_answer():
+    assert extract_answer("Thinking.\nANSWER: 5") == (5, (10, 19), None)
+    assert extract_answer("no idea") == (None, None, NO_ANSWER)
+    assert extract_answer("ANSWER: 8").reason == OUT_OF_RANGE
+    assert extract_answer("ANSWER: 8", levels=10).scorable
+    assert not is_scorable(None)
+
+
+def test_first_answer_wins():
+    assert extract_answer("ANSWER: 2 ... ANSWER: 6").value == 2
+
+
+def test_batch_matches_single():
+    batch = extract_answers(COMPLETIONS)
+
+    for i, completion in enumerate(COMPLETIONS):
+        single = extract_answer(completion)
+        assert batch.scorable[i] == single.scorable
+        assert batch.reason(i) == single.reason
+        if single.value is not None:
+            assert batch.values[i] == single.value
+            assert (batch.starts[i], batch.ends[i]) == single.span
+
+
+def test_oversized_answer_is_out_of_range():
+    for digits in ("99999999999999999999", "9" * 5000):
+        completion = f"ANSWER: {digits}"
+        assert extract_answer(completion).value is None
+        assert extract_answer(completion).reason == OUT_OF_RANGE
+        batch = extract_answers([completion])
+        assert batch.values.tolist() == [-1] and batch.reason(0) == OUT_OF_RANGE
+    assert extract_answer("ANSWER: 00000000000000000000004").value == 4
+
+
+def test_batch_per_completion_levels():
+    batch = extract_answers(["ANSWER: 5", "ANSWER: 5"], levels=[7, 4])
+    assert batch.scorable.tolist() == [True, False]
+
+
+def test_batch_empty():
+    assert len(extract_answers([]).scorable) == 0
+
+
+@pytest.mark.asyncio
+async def test_likert_rejects_out_of_range_answer():
+    score = await likert()(MockTaskState("ANSWER: 9", levels=7), None)
+
+    assert score.value == "N"
+    assert "outside the 1-7 scale" in score.explanation
+
+
+@pytest.mark.asyncio
+async def test_likert_rejects_oversized_answer():
+    score = await likert()(MockTaskState("ANSWER: " + "9" * 5000, levels=7), None)
+
+    assert score.value == "N"
+    assert "over 18 digits is outside the 1-7 scale" in score.explanation
@@ -0,0 +1,41 @@
+"""Import-time regression tests for the task entry point."""
+
+import subprocess
+import sys
+
+# Generous ceiling on the summed self-time of specieval's own modules; today it
+# is ~10ms. inspect_ai's import cost is excluded since we don't control it.
+SPECIEVAL_IMPORT_BUDGET_US = 250_000
+
+
+def _importtime(code: str) -> dict[str, int]:
+    """Run `code` under -X importtime and return module -> self time (us)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = times.get(name.strip(), 0) + int(self_us)
+    return times
+
+
+def test_task_entry_point_does_not_import_pandas():
+    """Registering and building tasks must not pull in pandas."""
+    times = _importtime(
+        "import specieval.tasks as t; [t.speciesism(), t.sentience(), "
+        "t.attitude_meat(), t.attitude_seafood(reverse=True)]"
+    )
+    assert "pandas" not in times
+
+
+def test_specieval_import_time_budget():
+    """specieval's own modules stay cheap to import."""
+    times = _importtime("import specieval.tasks")
+    own = sum(t for name, t in times.items() if name.split(".")[0] == "specieval")
+    assert own < SPECIEVAL_IMPORT_BUDGET_US, f"specieval imports took {own}us"
@@ -0,0 +1,231 @@
+"""Tests for the shared log scan."""
+
+import math
+from pathlib import Path
+
+import pytest
+from inspect_ai import eval
+from specieval.assessments import ASSESSMENTS
+from specieval.logscan import (
+    CompositeInputs,
+    DirectoryRefusals,
+    LogConsumer,
+    QuestionCounts,
+    RescoreScope,
+    scan,
+    summarize_log,
+)
+from specieval.tasks import speciesism, specieval_all, specieval_sweep
+
+
+@pytest.fixture
+def logs(tmp_path, mockllm_model):
+    logs_dir = tmp_path / "logs"
+    # 4 questions x 2 epochs, no refusals.
+    [en] = eval(
+        tasks=speciesism(epochs=2, retry_refusals=0),
+        model=mockllm_model(["ANSWER: 2", "ANSWER: 3", "ANSWER: 4", "ANSWER: 5"] * 2),
+        log_dir=str(logs_dir / "dir-a"),
+        max_samples=1,
+        display="none",
+    )
+    [de] = eval(
+        tasks=speciesism(
+            language="de", adaptive=True, min_epochs=2, epochs=3, retry_refusals=0
+        ),
+        model=mockllm_model(["ANSWER: 4", "No."] * 12),
+        log_dir=str(logs_dir / "dir-b"),
+        display="none",
+    )
+    return logs_dir, en, de
+
+
+def _paths(logs_dir):
+    return sorted(logs_dir.glob("**/*.eval"))
+
+
+class _Seen(LogConsumer):
+    def __init__(self, language):
+        self.language = language
+        self.logs = []
+
+    def accepts(self, log):
+        assert log.samples == []
+        return log.language == self.language
+
+    def add(self, log):
+        self.logs.append(log)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_scan_feeds_accepting_consumers(logs, jobs):
+    logs_dir, en, de = logs
+    english, german = _Seen("en"), _Seen("de")
+    assert scan(_paths(logs_dir), [english, german], jobs, sidecars=False) == []
+
+    [log] = english.logs
+    assert (log.model, log.task, log.language) == ("model", "speciesism", "en")
+    assert log.metrics["mean"] == en.results.scores[0].metrics["mean"].value
+    assert [s.sample_id for s in log.samples] == [
+        "spec_1",
+        "spec_2",
+        "spec_3",
+        "spec_4",
+    ] * 2
+    assert [s.value for s in log.samples] == [2, 3, 4, 5, 2, 3, 4, 5]
+
+    # Adaptive samples carry their internal epochs.
+    [log] = german.logs
+    assert all(len(s.epoch_values) >= 2 for s in log.samples)
+    assert sum(s.refused for s in log.samples) > 0
+
+
+def test_scan_reports_unreadable_logs(logs, tmp_path):
+    logs_dir, _, _ = logs
+    bad = logs_dir / "dir-a" / "bad.eval"
+    bad.write_text("not a zip")
+    counts = QuestionCounts()
+    [(path, error)] = scan(_paths(logs_dir), [counts], 1)
+    assert path == bad and isinstance(error, Exception)
+    assert len(counts.counts) == 4
+
+
+def test_consumers_share_one_scan(logs):
+    logs_dir, en, de = logs
+    counts = QuestionCounts()
+    refusals = DirectoryRefusals()
+    scope = RescoreScope(["model"])
+    inputs = CompositeInputs()
+    scan(_paths(logs_dir), [counts, refusals, scope, inputs])
+
+    # English only: 2 epochs per question, the rankings' view.
+    assert dict(counts.counts) == {
+        ("model", "speciesism", f"spec_{i}"): [2, 0] for i in range(1, 5)
+    }
+    assert counts.worst() == ("spec_1", 1.0)
+
+    assert refusals.totals["dir-a"] == [8, 0]
+    epochs, refused = refusals.totals["dir-b"]
+    assert refused > 0 and epochs > refused
+    assert dict(refusals.by_task["dir-b"]) == {"speciesism_de": refused}
+
+    # The English log has no refusals, and the German log is out of scope.
+    assert scope.paths == {}
+
+    scores, samples = inputs.frames()
+    assert scores.set_index("language")["score"].to_dict() == {
+        "en": en.results.scores[0].metrics["mean"].value,
+        "de": de.results.scores[0].metrics["mean"].value,
+    }
+    english = samples[samples["language"] == "en"].set_index("question")
+    assert english["score"].to_dict() == {
+        "spec_1": 2.0,
+        "spec_2": 3.0,
+        "spec_3": 4.0,
+        "spec_4": 5.0,
+    }
+    assert english.loc["spec_1", "epochs"] == [2.0, 2.0]
+    german = samples[samples["language"] == "de"]
+    assert german["epochs"].map(lambda v: any(map(math.isnan, v))).any()
+
+
+def test_sweep_samples_keep_their_language(tmp_path, mockllm_model):
+    [log] = eval(
+        tasks=specieval_sweep(
+            languages="en,th",
+            assessments="speciesism,sentience",
+            epochs=1,
+            retry_refusals=0,
+        ),
+        model=mockllm_model(["ANSWER: 4"] * 20),
+        log_dir=str(tmp_path),
+        display="none",
+    )
+    counts = QuestionCounts()
+    inputs = CompositeInputs()
+    scan([Path(log.location)], [counts, inputs])
+
+    # The gate counts the English samples only, each under its assessment.
+    assert dict(counts.counts) == {
+        ("model", name, question): [1, 0]
+        for name in ("speciesism", "sentience")
+        for question in ASSESSMENTS[name].questions
+    }
+
+    scores, samples = inputs.frames()
+    assert sorted(zip(scores["language"], scores["task"])) == [
+        ("en", "sentience"),
+        ("en", "speciesism"),
+        ("th", "sentience"),
+        ("th", "speciesism"),
+    ]
+    assert (scores["score"] == 4.0).all()
+    assert sorted(zip(samples["language"], samples["question"])) == sorted(
+        (language, question)
+        for language in ("en", "th")
+        for name in ("speciesism", "sentience")
+        for question in ASSESSMENTS[name].questions
+    )
+
+
+def test_specieval_all_counts_towards_each_assessment(tmp_path, mockllm_model):
+    [log] = eval(
+        tasks=specieval_all(epochs=1, retry_refusals=0),
+        model=mockllm_model(["ANSWER: 4"] * 18),
+        log_dir=str(tmp_path),
+        display="none",
+    )
+    counts = QuestionCounts()
+    scan([Path(log.location)], [counts])
+    assert {task for _, task, _ in counts.counts} == set(ASSESSMENTS)
+    assert dict(counts.counts) == {
+        ("model", name, question): [1, 0]
+        for name, assessment in ASSESSMENTS.items()
+        for question in assessment.questions
+    }
+
+
+def test_rescore_scope_selects_logs_with_refusals(tmp_path, mockllm_model):
+    [log] = eval(
+        tasks=speciesism(epochs=1, retry_refusals=0),
+        model=mockllm_model(["No.", "ANSWER: 3", "ANSWER: 4", "ANSWER: 5"]),
+        log_dir=str(tmp_path),
+        max_samples=1,
+        display="none",
+    )
+    path = Path(log.location)
+    scope = RescoreScope(["model"])
+    scan([path], [scope, RescoreScope(["other"])])
+    assert scope.paths == {path: "model"}
+
+
+def test_summarize_log_matches_scan(logs):
+    logs_dir, en, _ = logs
+    counts = QuestionCounts(english_only=False)
+    counts.add(summarize_log(en))
+    scanned = QuestionCounts(english_only=False)
+    scan([Path(en.location)], [scanned])
+    assert counts.counts == scanned.counts
+
+
+def test_sidecars_give_the_same_views(logs):
+    logs_dir, _, _ = logs
+    views = []
+    for sidecars in (False, True):
+        counts = QuestionCounts(english_only=False)
+        refusals = DirectoryRefusals()
+        inputs = CompositeInputs()
+        scan(_paths(logs_dir), [counts, refusals, inputs], sidecars=sidecars)
+        scores, samples = inputs.frames()
+        views.append((dict(counts.counts), dict(refusals.totals), scores, samples))
+
+    (counts, totals, scores, samples), (counts_, totals_, scores_, samples_) = views
+    assert counts == counts_ and totals == totals_
+    assert scores.equals(scores_)
+    assert samples.drop(columns="epochs").equals(samples_.drop(columns="epochs"))
+    assert samples["epochs"].map(len).equals(samples_["epochs"].map(len))
+
+
+def test_consumers_must_define_add():
+    with pytest.raises(TypeError):
+        LogConsumer()
@@ -0,0 +1,179 @@
+"""Tests for the logs.json manifest reader and incremental updates."""
+
+import json
+import os
+
+import ijson
+import pytest
+from inspect_ai import eval
+from inspect_ai.log import write_eval_log, write_log_dir_manifest
+from specieval.manifest import (
+    INDEX_NAME,
+    ManifestLog,
+    ManifestSample,
+    ManifestUpdate,
+    read_manifest,
+    update_manifest,
+)
+from specieval.tasks import speciesism
+
+
+def _entry(model, metrics, samples, language=None):
+    task_args = {} if language is None else {"language": language}
+    return {
+        "status": "success",
+        "eval": {
+            "model": model,
+            "task_registry_name": "specieval/speciesism",
+            "task_args": task_args,
+        },
+        "results": {
+            "scores": [
+                {
+                    "name": "likert",
+                    "metrics": {
+                        name: {"name": name, "value": value}
+                        for name, value in metrics.items()
+                    },
+                },
+                {"name": "other", "metrics": {"mean": {"value": 0.0}}},
+            ]
+        },
+        "reductions": [
+            {"scorer": "likert", "samples": samples},
+            {"scorer": "other", "samples": [{"sample_id": "x", "value": 0}]},
+        ],
+    }
+
+
+def test_read_manifest_keeps_used_fields(tmp_path):
+    path = tmp_path / "logs.json"
+    manifest = {
+        "2025-01-01T00-00-00_speciesism_a.eval": _entry(
+            "openai/gpt-4.1",
+            {"mean": 4.5, "std": 1.0},
+            [
+                {"sample_id": "spec_1", "value": 4.0, "explanation": "ANSWER: 4"},
+                {
+                    "sample_id": "spec_2",
+                    "value": "N",
+                    "metadata": {"epoch_values": ["N", "N"], "other": [1]},
+                },
+                {"sample_id": 3, "value": 5.5, "metadata": {"epoch_values": [5, 6]}},
+            ],
+        ),
+        "2025-01-02T00-00-00_speciesism_b.eval": _entry(
+            "anthropic/claude", {"mean": 3.0}, [], language="de"
+        ),
+    }
+    path.write_text(json.dumps(manifest))
+
+    assert list(read_manifest(path)) == [
+        ManifestLog(
+            name="2025-01-01T00-00-00_speciesism_a.eval",
+            status="success",
+            model="openai/gpt-4.1",
+            task_registry_name="specieval/speciesism",
+            language=None,
+            metrics={"mean": 4.5, "std": 1.0},
+            samples=[
+                ManifestSample("spec_1", 4.0, None),
+                ManifestSample("spec_2", "N", ["N", "N"]),
+                ManifestSample("3", 5.5, [5.0, 6.0]),
+            ],
+        ),
+        ManifestLog(
+            name="2025-01-02T00-00-00_speciesism_b.eval",
+            status="success",
+            model="anthropic/claude",
+            task_registry_name="specieval/speciesism",
+            language="de",
+            metrics={"mean": 3.0},
+            samples=[],
+        ),
+    ]
+
+
+def test_read_manifest_matches_json(tmp_path, mockllm_model):
+    eval(
+        tasks=speciesism(epochs=2, retry_refusals=0),
+        model=mockllm_model(["ANSWER: 2", "No."] * 4),
+        log_dir=str(tmp_path),
+        display="none",
+    )
+    write_log_dir_manifest(str(tmp_path))
+    manifest = json.loads((tmp_path / "logs.json").read_text())
+
+    [log] = read_manifest(tmp_path / "logs.json")
+    [(name, entry)] = manifest.items()
+    assert log.name == name
+    assert log.model == entry["eval"]["model"]
+    assert log.metrics == {
+        name: metric["value"]
+        for name, metric in entry["results"]["scores"][0]["metrics"].items()
+    }
+    expected = entry["reductions"][0]["samples"]
+    assert [s.sample_id for s in log.samples] == [s["sample_id"] for s in expected]
+    assert [s.value for s in log.samples] == [s["value"] for s in expected]
+    assert [s.epoch_values for s in log.samples] == [
+        s["metadata"]["epoch_values"] for s in expected
+    ]
+
+
+def test_read_manifest_invalid_json(tmp_path):
+    path = tmp_path / "logs.json"
+    path.write_text('{"a.eval": {"status": "success"}, "b.eval": {')
+
+    logs = read_manifest(path)
+    assert next(logs).status == "success"
+    with pytest.raises(ijson.JSONError):
+        list(logs)
+
+
+def _run(log_dir, model):
+    [log] = eval(
+        tasks=speciesism(epochs=1, retry_refusals=0),
+        model=model,
+        log_dir=str(log_dir),
+        max_samples=1,
+        display="none",
+    )
+    return log
+
+
+def test_update_manifest_matches_inspect(tmp_path, mockllm_model):
+    _run(tmp_path, mockllm_model(["ANSWER: 2"] * 4))
+    _run(tmp_path, mockllm_model(["ANSWER: 5", "No."] * 2))
+
+    assert update_manifest(tmp_path) == ManifestUpdate(2, 0, 0)
+    ours = (tmp_path / "logs.json").read_bytes()
+    write_log_dir_manifest(str(tmp_path))
+    assert (tmp_path / "logs.json").read_bytes() == ours
+    assert len(list(read_manifest(tmp_path / "logs.json"))) == 2
+
+
+def test_update_manifest_reads_only_changes(tmp_path, mockllm_model):
+    first = _run(tmp_path, mockllm_model(["ANSWER: 2"] * 4))
+    second = _run(tmp_path, mockllm_model(["ANSWER: 5"] * 4))
+    update_manifest(tmp_path)
+    assert update_manifest(tmp_path) == ManifestUpdate(0, 2, 0)
+
+    # Touched but identical: matched by hash, not re-read.
+    path = first.location.removeprefix("file://")
+    os.utime(path, ns=(0, 0))
+    assert update_manifest(tmp_path) == ManifestUpdate(0, 2, 0)
+
+    # Rewritten with different contents: re-read and patched.
+    first.results.scores[0].metrics["mean"].value = 1.5
+    write_eval_log(first, path, format="eval")
+    assert update_manifest(tmp_path) == ManifestUpdate(1, 1, 0)
+    logs = {log.name: log for log in read_manifest(tmp_path / "logs.json")}
+    assert logs[os.path.basename(path)].metrics["mean"] == 1.5
+
+    # Deleted: dropped from the manifest and the index.
+    os.remove(second.location.removeprefix("file://"))
+    assert update_manifest(tmp_path) == ManifestUpdate(0, 1, 1)
+    names = [log.name for log in read_manifest(tmp_path / "logs.json")]
+    index = json.loads((tmp_path / INDEX_NAME).read_text())
+    assert names == list(index) == [os.path.basename(path)]
+    assert not list(tmp_path.glob("*.tmp"))
@@ -77,3 +77,33 @@ def test_metrics_named_for_analysis_keys():
 
     assert registry_info(mean()).name == "specieval/mean"
     assert registry_info(std()).name == "specieval/std"
+
+
+def test_moments_match_statistics_and_numpy_exactly():
+    """Running moments agree with the list-based results to the last ulp."""
+    import statistics
+
+    from specieval.scorers.refusal import moments
+
+    rng = np.random.default_rng(0)
+    for n in (1, 2, 10, 63, 64, 1000, 20_000):
+        floats = rng.uniform(1, 7, n).tolist()
+        likert = rng.integers(1, 8, n).tolist()
+        for valid in (floats, likert):
+            values = [NOANSWER if i % 7 == 3 else v for i, v in enumerate(valid)]
+            kept = [float(v) for v in values if v != NOANSWER]
+            m = moments(values, variance=True)
+            assert (m.valid, m.refusals) == (len(kept), n - len(kept))
+            assert m.mean == statistics.mean(kept)
+            assert mean()(_sample_scores(values)) == statistics.mean(kept)
+            if len(kept) > 1:
+                assert std()(_sample_scores(values)) == float(np.std(kept, ddof=1))
+
+
+def test_moments_custom_to_float_and_non_finite():
+    from specieval.scorers.refusal import moments
+
+    m = moments([True, False, NOANSWER], to_float=lambda v: 10.0 if v else 0.0)
+    assert (m.valid, m.refusals, m.mean) == (2, 1, 5.0)
+    assert np.isnan(m.variance)  # not requested
+    assert mean()(_sample_scores([1.0, float("inf")])) == float("inf")
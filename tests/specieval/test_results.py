@@ -0,0 +1,153 @@
+"""Tests for the columnar results store."""
+
+import os
+
+import pytest
+from inspect_ai import eval
+from inspect_ai.log import read_eval_log, write_eval_log
+from specieval.results import (
+    assessment_scores,
+    ingest,
+    normalize_question,
+    question_scores,
+    read_catalog,
+    read_results,
+)
+from specieval.tasks import speciesism
+
+
+@pytest.fixture
+def logs(tmp_path, mockllm_model):
+    logs_dir = tmp_path / "logs"
+    # 4 questions x 2 epochs, run one sample at a time: the first generation
+    # refuses and is re-prompted, and the last epoch refuses for good.
+    [en] = eval(
+        tasks=speciesism(epochs=2, retry_refusals=1),
+        model=mockllm_model(
+            ["No.", "ANSWER: 2", "ANSWER: 3", "ANSWER: 4", "ANSWER: 5"]
+            + ["ANSWER: 6"] * 3
+            + ["No.", "No."]
+        ),
+        log_dir=str(logs_dir / "model-a"),
+        max_samples=1,
+        display="none",
+    )
+    [de] = eval(
+        tasks=speciesism(language="de", adaptive=True, min_epochs=2, epochs=3),
+        model=mockllm_model(["ANSWER: 4"] * 8),
+        log_dir=str(logs_dir / "model-a"),
+        display="none",
+    )
+    return logs_dir, en, de
+
+
+def test_ingest_one_row_per_sample_epoch(logs, tmp_path):
+    logs_dir, _, _ = logs
+    store = tmp_path / "results"
+
+    assert ingest(logs_dir, store) == (2, 0, 0, 0)
+    assert sorted(p.relative_to(store).parts[:3] for p in store.rglob("*.parquet")) == [
+        ("model=model", "task=speciesism", "language=de"),
+        ("model=model", "task=speciesism", "language=en"),
+    ]
+
+    results = read_results(store, filters=[("language", "=", "en")])
+    assert len(results) == 8
+    assert set(results["assessment"]) == {"speciesism"}
+    assert results["log"].str.startswith("model-a/").all()
+    assert (results["input_tokens"] > 0).all() and (results["latency"] > 0).all()
+    answered = results[~results["refused"]]
+    assert (answered["answer"] == answered["score"]).all()
+    assert sorted(results["attempts"]) == [1] * 6 + [2, 2]
+
+    refused = results[results["refused"]]
+    assert len(refused) == 1
+    assert refused["score"].isna().all() and refused["answer"].isna().all()
+
+
+def test_ingest_oversized_answer(tmp_path, mockllm_model):
+    logs_dir = tmp_path / "logs"
+    eval(
+        tasks=speciesism(epochs=1, retry_refusals=0),
+        model=mockllm_model(["ANSWER: 99999999999999999999"] + ["ANSWER: 4"] * 3),
+        log_dir=str(logs_dir / "model-a"),
+        max_samples=1,
+        display="none",
+    )
+    store = tmp_path / "results"
+    assert ingest(logs_dir, store) == (1, 0, 0, 0)
+
+    results = read_results(store)
+    oversized = results[results["sample_id"] == "spec_1"]
+    assert oversized["answer"].isna().all() and oversized["refused"].all()
+    assert (results.loc[~results["refused"], "answer"] == 4).all()
+
+
+def test_aggregates_match_logged_metrics(logs, tmp_path):
+    logs_dir, en, de = logs
+    store = tmp_path / "results"
+    ingest(logs_dir, store)
+    results = read_results(store)
+
+    questions = question_scores(results)
+    assert len(questions) == 8
+    assert questions["epoch_values"].map(len).tolist() == [2] * 8
+
+    # Adaptive samples are expanded into their internal epochs.
+    rows = results[results["language"] == "de"]
+    assert len(rows) == 8 and rows["latency"].isna().all()
+    assert (rows["attempts"] == 1).all() and (rows["answer"] == 4).all()
+
+    scores = assessment_scores(results).set_index("language")["score"]
+    for language, log in [("en", en), ("de", de)]:
+        logged = log.results.scores[0].metrics["mean"].value
+        assert scores[language] == pytest.approx(logged)
+
+
+def test_normalize_question():
+    assert normalize_question("am_1") == "la4N_1"
+    assert normalize_question("asf_2") == "se4N_2"
+    assert normalize_question("spec_1") == "spec_1"
+
+
+def test_incremental_ingest(logs, tmp_path):
+    logs_dir, en, de = logs
+    store = tmp_path / "results"
+    ingest(logs_dir, store)
+    catalog = read_catalog(store)
+    en_path = en.location.removeprefix("file://")
+    en_key = os.path.relpath(en_path, logs_dir)
+    entry = catalog[en_key]
+    assert (entry["model"], entry["task"], entry["language"], entry["status"]) == (
+        "mockllm/model",
+        "specieval/speciesism",
+        "en",
+        "success",
+    )
+    parquet = store / entry["files"][0]
+    written = parquet.stat().st_mtime_ns
+
+    # Nothing changed: nothing is re-read or rewritten.
+    assert ingest(logs_dir, store) == (0, 0, 2, 0)
+    # Touched but identical contents: recognised by hash.
+    os.utime(en_path, (1, 1))
+    assert ingest(logs_dir, store) == (0, 0, 2, 0)
+    assert parquet.stat().st_mtime_ns == written
+    assert read_catalog(store)[en_key]["mtime"] == 1
+
+    # Rewritten in place (as rescore.py does): its rows are replaced.
+    log = read_eval_log(en_path)
+    for sample in log.samples:
+        for score in sample.scores.values():
+            score.value = 7
+    write_eval_log(log, en_path)
+    assert ingest(logs_dir, store) == (0, 1, 1, 0)
+    rows = read_results(store, filters=[("language", "=", "en")])
+    assert len(rows) == 8 and (rows["score"] == 7).all()
+
+    # Deleted: its rows and partition are dropped.
+    os.remove(en_path)
+    assert ingest(logs_dir, store) == (0, 0, 1, 1)
+    assert set(read_results(store)["language"]) == {"de"}
+    assert not (store / entry["files"][0]).parent.exists()
+    assert en_key not in read_catalog(store)
@@ -1,42 +1,23 @@
 """Tests for the retry-on-refusal solver."""
 
-import pytest
-from inspect_ai.model import ChatMessageAssistant, ModelName, ModelOutput
-from inspect_ai.solver import TaskState
-from specieval.solvers.retry import generate_until_answered
-
-
-def _make_generate(scripted):
-    """A fake generate() that returns the scripted completions in order."""
-    calls = {"n": 0}
-
-    async def fake_generate(state, **kwargs):
-        out = scripted[min(calls["n"], len(scripted) - 1)]
-        calls["n"] += 1
-        state.output = ModelOutput.from_content("mockllm/model", out)
-        state.messages.append(ChatMessageAssistant(content=out))
-        return state
-
-    return fake_generate, calls
-
+import asyncio
 
-def _state():
-    return TaskState(
-        model=ModelName("mockllm/model"),
-        sample_id="x",
-        epoch=1,
-        input="rate this",
-        messages=[],
-    )
+import pytest
+from inspect_ai.model import (
+    ChatMessageUser,
+    ModelOutput,
+    ModelUsage,
+)
+from specieval.solvers.retry import ATTEMPTS_KEY, generate_until_answered
 
 
 @pytest.mark.asyncio
-async def test_retries_until_answered():
+async def test_retries_until_answered(make_generate, make_state):
     """Re-prompts on unparseable output and recovers a later valid answer."""
-    generate, calls = _make_generate(
+    generate, calls = make_generate(
         ["I won't answer.", "**7 = Strongly Agree**", "ANSWER: 5"]
     )
-    state = await generate_until_answered(max_attempts=3)(_state(), generate)
+    state = await generate_until_answered(max_attempts=3)(make_state(), generate)
 
     assert calls["n"] == 3
     assert state.output.completion == "ANSWER: 5"
@@ -45,10 +26,10 @@ async def test_retries_until_answered():
 
 
 @pytest.mark.asyncio
-async def test_stops_on_first_valid_answer():
+async def test_stops_on_first_valid_answer(make_generate, make_state):
     """No extra generations or nudges once a parseable answer appears."""
-    generate, calls = _make_generate(["ANSWER: 6", "unused"])
-    state = await generate_until_answered(max_attempts=3)(_state(), generate)
+    generate, calls = make_generate(["ANSWER: 6", "unused"])
+    state = await generate_until_answered(max_attempts=3)(make_state(), generate)
 
     assert calls["n"] == 1
     assert state.output.completion == "ANSWER: 6"
@@ -56,10 +37,122 @@ async def test_stops_on_first_valid_answer():
 
 
 @pytest.mark.asyncio
-async def test_gives_up_after_max_attempts():
+async def test_gives_up_after_max_attempts(make_generate, make_state):
     """A persistent refusal exhausts attempts and falls through unscored."""
-    generate, calls = _make_generate(["nope"])
-    state = await generate_until_answered(max_attempts=3)(_state(), generate)
+    generate, calls = make_generate(["nope"])
+    state = await generate_until_answered(max_attempts=3)(make_state(), generate)
+
+    assert calls["n"] == 3
+    assert "ANSWER" not in state.output.completion
+
+
+async def _sent_lengths(make_generate, make_state, history):
+    """Messages sent per attempt for five refusals in a row."""
+    sent = []
+    generate, _ = make_generate(["nope"])
+
+    async def recording_generate(state, **kwargs):
+        sent.append(len(state.messages))
+        return await generate(state, **kwargs)
+
+    state = make_state()
+    state.messages = [ChatMessageUser(content="rate this")]
+    solver = generate_until_answered(max_attempts=5, history=history)
+    return sent, await solver(state, recording_generate)
+
+
+@pytest.mark.asyncio
+async def test_full_history_grows_with_attempts(make_generate, make_state):
+    sent, _ = await _sent_lengths(make_generate, make_state, history=None)
+    assert sent == [1, 3, 5, 7, 9]
+
+
+@pytest.mark.asyncio
+async def test_reset_history_resends_prompt_and_one_nudge(make_generate, make_state):
+    sent, state = await _sent_lengths(make_generate, make_state, history=0)
+    assert sent == [1, 2, 2, 2, 2]
+    assert [m.role for m in state.messages] == ["user", "user", "assistant"]
+
 
+@pytest.mark.asyncio
+async def test_bounded_history_keeps_last_attempts(make_generate, make_state):
+    sent, _ = await _sent_lengths(make_generate, make_state, history=2)
+    assert sent == [1, 3, 5, 5, 5]
+
+
+@pytest.mark.asyncio
+async def test_attempts_recorded_with_usage(make_generate, make_state):
+    _, state = await _sent_lengths(make_generate, make_state, history=0)
+    attempts = state.store.get(ATTEMPTS_KEY)
+
+    assert [a["attempt"] for a in attempts] == [1, 2, 3, 4, 5]
+    assert all(a["completion"] == "nope" for a in attempts)
+    assert all("input_tokens" in a and "output_tokens" in a for a in attempts)
+
+
+def _make_racing_generate(replies):
+    """A fake generate() whose n-th call returns (completion, delay) replies[n]."""
+    calls = {"n": 0, "finished": 0, "cancelled": 0}
+
+    async def fake_generate(state, **kwargs):
+        out, delay = replies[min(calls["n"], len(replies) - 1)]
+        calls["n"] += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            calls["cancelled"] += 1
+            raise
+        calls["finished"] += 1
+        state.output = ModelOutput.from_content("mockllm/model", out)
+        state.output.usage = ModelUsage(
+            input_tokens=10, output_tokens=len(out), total_tokens=10 + len(out)
+        )
+        state.messages.append(state.output.message)
+        return state
+
+    return fake_generate, calls
+
+
+@pytest.mark.asyncio
+async def test_race_keeps_first_scorable_candidate(make_state):
+    """The fastest scorable candidate wins and the slower ones are cancelled."""
+    generate, calls = _make_racing_generate(
+        [("nope", 0.0), ("ANSWER: 6", 0.01), ("ANSWER: 2", 0.5)]
+    )
+    solver = generate_until_answered(max_attempts=3, candidates=3)
+    state = await solver(make_state(), generate)
+
+    assert state.output.completion == "ANSWER: 6"
     assert calls["n"] == 3
+    assert calls["finished"] == 2
+    # The losing candidate's cancellation has completed by the time we return.
+    assert calls["cancelled"] == 1
+    [attempt] = state.store.get(ATTEMPTS_KEY)
+    assert attempt["candidates"] == 3
+    assert attempt["winner"] == 1
+    # Tokens of both finished candidates, not only the winner's.
+    assert attempt["input_tokens"] == 20
+    assert attempt["output_tokens"] == len("nope") + len("ANSWER: 6")
+    assert [m.role for m in state.messages] == ["assistant"]
+
+
+@pytest.mark.asyncio
+async def test_race_budget_counts_every_candidate(make_state):
+    """A persistent refusal spends max_attempts generations in fewer rounds."""
+    generate, calls = _make_racing_generate([("nope", 0.0)])
+    solver = generate_until_answered(max_attempts=5, candidates=2)
+    state = await solver(make_state(), generate)
+
+    assert calls["n"] == 5
+    assert [a["candidates"] for a in state.store.get(ATTEMPTS_KEY)] == [2, 2, 1]
     assert "ANSWER" not in state.output.completion
+
+
+@pytest.mark.asyncio
+async def test_out_of_range_answer_is_retried(make_generate, make_state):
+    """An answer off the Likert scale counts as unscorable."""
+    generate, calls = make_generate(["ANSWER: 9", "ANSWER: 3"])
+    state = await generate_until_answered(max_attempts=3)(make_state(), generate)
+
+    assert calls["n"] == 2
+    assert state.output.completion == "ANSWER: 3"
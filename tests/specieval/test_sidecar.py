@@ -0,0 +1,94 @@
+"""Tests for the per-log summary sidecars."""
+
+import os
+from pathlib import Path
+
+from inspect_ai import eval
+from inspect_ai.log import list_eval_logs, read_eval_log, write_eval_log
+from specieval.sidecar import backfill, read_sidecar, sidecar_path
+from specieval.tasks import speciesism
+
+
+def _run(log_dir, model, **task_args):
+    [log] = eval(
+        tasks=speciesism(**task_args),
+        model=model,
+        log_dir=str(log_dir),
+        max_samples=1,
+        display="none",
+    )
+    return log, Path(log.location)
+
+
+def test_sidecar_written_at_task_end(tmp_path, mockllm_model):
+    # 4 questions x 2 epochs; spec_1 first refuses and is re-prompted, and
+    # refuses for good in the second epoch.
+    log, path = _run(
+        tmp_path,
+        mockllm_model(
+            ["No.", "ANSWER: 2", "ANSWER: 3", "ANSWER: 4", "ANSWER: 5"]
+            + ["No.", "No.", "ANSWER: 3", "ANSWER: 4", "ANSWER: 5"]
+        ),
+        epochs=2,
+        retry_refusals=1,
+    )
+    sidecar = read_sidecar(path)
+    assert sidecar is not None
+    assert (sidecar["status"], sidecar["model"], sidecar["language"]) == (
+        "success",
+        "mockllm/model",
+        "en",
+    )
+    assert sidecar["metrics"]["mean"] == log.results.scores[0].metrics["mean"].value
+
+    questions = sidecar["questions"]
+    assert list(questions) == ["spec_1", "spec_2", "spec_3", "spec_4"]
+    # [refused, 1, ..., 7]
+    assert questions["spec_1"]["counts"] == [1, 0, 1, 0, 0, 0, 0, 0]
+    assert questions["spec_4"]["counts"] == [0, 0, 0, 0, 0, 2, 0, 0]
+    assert questions["spec_1"]["attempts"] == 4
+    assert questions["spec_2"]["attempts"] == 2
+    assert all(q["input_tokens"] > 0 for q in questions.values())
+
+    # Inspect never takes a sidecar for a log.
+    assert [
+        Path(i.name.removeprefix("file://")) for i in list_eval_logs(str(tmp_path))
+    ] == [path]
+
+
+def test_stale_sidecar_ignored_and_backfilled(tmp_path, mockllm_model):
+    log, path = _run(tmp_path, mockllm_model(["ANSWER: 4"] * 4), epochs=1)
+    assert read_sidecar(path) is not None
+    assert backfill(tmp_path) == (0, 1, 0)
+
+    # Rewritten log: the sidecar no longer describes it.
+    log = read_eval_log(str(path))
+    for sample in log.samples:
+        for score in sample.scores.values():
+            score.value = "N"
+    write_eval_log(log, str(path))
+    assert read_sidecar(path) is None
+
+    assert backfill(tmp_path) == (1, 0, 0)
+    counts = [q["counts"] for q in read_sidecar(path)["questions"].values()]
+    assert counts == [[1] + [0] * 7] * 4
+
+    # Missing sidecar.
+    os.remove(sidecar_path(path))
+    assert read_sidecar(path) is None
+    assert backfill(tmp_path) == (1, 0, 0)
+    assert backfill(tmp_path, full=True) == (1, 0, 0)
+
+
+def test_adaptive_sidecar_counts_internal_epochs(tmp_path, mockllm_model):
+    _, path = _run(
+        tmp_path,
+        mockllm_model(["ANSWER: 4"] * 8),
+        language="de",
+        adaptive=True,
+        min_epochs=2,
+        epochs=3,
+    )
+    sidecar = read_sidecar(path)
+    assert sidecar["language"] == "de"
+    assert all(q["counts"][4] == 2 for q in sidecar["questions"].values())
@@ -2,6 +2,12 @@
 
 import pytest
 from specieval.translations import Language, Translations
+from specieval.translations.bundle import BUNDLE_NAME, build_bundle
+from specieval.translations.translations import (
+    _load_catalog,
+    default_path,
+    parse_csv,
+)
 
 
 def test_translations_loads_default():
@@ -99,3 +105,64 @@ def test_all_languages_have_core_strings():
             result = translations.get_string(string_id, lang)
             assert result is not None, f"Missing {string_id} for {lang}"
             assert len(result) > 0, f"Empty {string_id} for {lang}"
+
+
+def test_catalog_is_shared_between_instances():
+    """Repeated construction reuses one parsed catalog per file."""
+    assert Translations().catalog is Translations().catalog
+    assert Translations(reverse=True).catalog is Translations(reverse=True).catalog
+    assert Translations().catalog is not Translations(reverse=True).catalog
+
+
+def test_catalog_matches_dataframe():
+    """Every indexed entry agrees with the underlying CSV row."""
+    translations = Translations()
+
+    for _, row in translations.df.iterrows():
+        for lang in Language:
+            assert translations.get_string(row["string_id"], lang) == row[str(lang)]
+
+
+def test_get_string_missing_language():
+    """A language absent from the file raises ValueError, not KeyError."""
+    translations = Translations(reverse=True)
+
+    assert translations.get_string("spec_1", Language.ENGLISH)
+    with pytest.raises(ValueError):
+        translations.get_string("spec_1", Language.GERMAN)
+
+
+def test_bundle_is_up_to_date():
+    """The committed bundle matches a fresh compile of the CSVs."""
+    data_dir = default_path().parent
+    expected = build_bundle(sorted(data_dir.glob("*.csv")))
+
+    assert (data_dir / BUNDLE_NAME).read_bytes() == expected
+
+
+def test_default_catalogs_load_from_bundle():
+    """Both shipped CSVs are served from the bundle, matching the CSV parse."""
+    for reverse in (False, True):
+        catalog = Translations(reverse=reverse).catalog
+        string_ids, languages, entries = parse_csv(catalog.path.read_text("utf-8"))
+
+        assert catalog.source == "bundle"
+        assert dict(catalog.entries) == entries
+        assert catalog.string_ids == frozenset(string_ids)
+        assert catalog.languages == frozenset(languages)
+
+
+def test_stale_bundle_falls_back_to_csv(tmp_path):
+    """A CSV edited after the bundle was built is parsed directly."""
+    csv_path = tmp_path / "translations.csv"
+    csv_path.write_text('string_id,en\nspec_1,"Original"\n', encoding="utf-8")
+    (tmp_path / BUNDLE_NAME).write_bytes(build_bundle([csv_path]))
+
+    assert Translations(path=csv_path).catalog.source == "bundle"
+
+    csv_path.write_text('string_id,en\nspec_1,"Edited"\n', encoding="utf-8")
+    _load_catalog.cache_clear()
+    translations = Translations(path=csv_path)
+
+    assert translations.catalog.source == "csv"
+    assert translations.get_string("spec_1") == "Edited"